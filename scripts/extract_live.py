@@ -12,6 +12,9 @@ Usage:
     # Force re-extract ALL messages (uses LLM API!)
     python scripts/extract_live.py --all
 
+    # Limit concurrent extraction calls (default: 8)
+    EXTRACT_CONCURRENCY=4 python scripts/extract_live.py
+
 The script will:
 1. Read the event log
 2. Find message_ingested events
@@ -27,17 +30,17 @@ import asyncio
 import sys
 import os
 from pathlib import Path
-from collections import defaultdict
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.contracts import SourceType
+from shared.contracts import EventType
 from services.event_store.file_store import FileEventStore
 from services.ingestion.service import IngestionService
 from services.extraction.service import ExtractionService
 from services.extraction.openai_client import OpenAILLMService
 from services.extraction.mock_llm import MockLLMService
+from shared.common.runner import run
 
 
 async def main():
@@ -67,27 +70,20 @@ async def main():
     
     extraction = ExtractionService(event_store, llm_service)
     
-    # Read all events
+    # Read message and extraction events in a single pass
     print("Reading event log...")
-    events = await event_store.stream_events()
-    
-    # Find all message_ingested events
     ingested_messages = {}
-    for event in events:
-        if event.event_type == "message_ingested":
+    extracted_source_ids = set()
+    async for event in event_store.iter_events(
+        event_types=[EventType.MESSAGE_INGESTED, EventType.OBJECT_EXTRACTED]
+    ):
+        if event.event_type == EventType.MESSAGE_INGESTED:
             ingested_messages[event.event_id] = {
                 "content": event.content,
                 "source_id": event.source_id,
-                "extracted": False,
             }
-    
-    # Mark which messages have been extracted
-    if not force_all:
-        for event in events:
-            if event.event_type == "object_extracted":
-                source_evt_id = event.source_event_id
-                if source_evt_id in ingested_messages:
-                    ingested_messages[source_evt_id]["extracted"] = True
+        elif not force_all:
+            extracted_source_ids.add(event.source_event_id)
     
     # Filter to unprocessed messages
     if force_all:
@@ -97,7 +93,7 @@ async def main():
         to_extract = [
             (msg_id, data) 
             for msg_id, data in ingested_messages.items() 
-            if not data["extracted"]
+            if msg_id not in extracted_source_ids
         ]
         print(f"Found {len(to_extract)} unprocessed messages")
     
@@ -108,26 +104,33 @@ async def main():
     
     print("Running extraction...\n")
     
-    # Extract objects from each message
+    # Extract objects concurrently; LLM calls dominate, so overlap them
+    concurrency = max(1, int(os.getenv("EXTRACT_CONCURRENCY", "8")))
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run_extraction(msg_id):
+        async with semaphore:
+            try:
+                # Call extraction service
+                result = await extraction.extract_from_message(
+                    message_event_id=msg_id,
+                )
+                return msg_id, len(result), None
+            except Exception as e:
+                return msg_id, 0, e
+    
     extraction_count = 0
     error_count = 0
     
-    for msg_id, data in to_extract:
-        try:
-            # Call extraction service
-            result = await extraction.extract_from_message(
-                message_event_id=msg_id,
-            )
-            
-            # Count extracted objects
-            obj_count = len(result)
+    # Report each message as soon as it finishes
+    tasks = [run_extraction(msg_id) for msg_id, _ in to_extract]
+    for finished in asyncio.as_completed(tasks):
+        msg_id, obj_count, error = await finished
+        if error is None:
             extraction_count += obj_count
-            
-            # Report
             print(f"✓ {str(msg_id)[:12]}... → {obj_count} objects extracted")
-            
-        except Exception as e:
-            print(f"✗ {str(msg_id)[:12]}... → Error: {e}")
+        else:
+            print(f"✗ {str(msg_id)[:12]}... → Error: {error}")
             error_count += 1
     
     print(f"\n{'='*60}")
@@ -146,5 +149,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run(main())
     sys.exit(exit_code)
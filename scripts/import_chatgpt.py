@@ -7,6 +7,9 @@ extraction to create todos, notes, and tracks from the conversation history.
 Usage:
     python scripts/import_chatgpt.py <path-to-conversations.json>
 
+Set IMPORT_CONCURRENCY to change how many messages are processed at once
+(default: 8).
+
 The ChatGPT export format has this structure:
 {
   "conversations": [
@@ -33,13 +36,15 @@ The ChatGPT export format has this structure:
 """
 
 import asyncio
-import json
 import logging
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
 from uuid import uuid5, NAMESPACE_DNS
 
+import orjson
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -49,6 +54,7 @@ from services.ingestion.service import IngestionService
 from services.extraction.service import ExtractionService
 from services.extraction.openai_client import OpenAILLMService
 from shared.common.config import Config
+from shared.common.runner import run
 
 logging.basicConfig(
     level=logging.INFO,
@@ -56,13 +62,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_EMPTY: dict = {}
+
 
 def load_chatgpt_export(file_path: Path) -> dict:
     """Load ChatGPT export JSON file."""
     logger.info(f"Loading ChatGPT export from: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # orjson parses the raw bytes directly, skipping the str decode json.load needs
+    data = orjson.loads(file_path.read_bytes())
     
     if 'conversations' not in data:
         raise ValueError("Invalid ChatGPT export format: missing 'conversations' key")
@@ -74,39 +82,32 @@ def load_chatgpt_export(file_path: Path) -> dict:
 def extract_messages_from_conversation(conversation: dict) -> list[dict]:
     """Extract messages from a conversation mapping."""
     messages = []
+    append = messages.append
     
     conversation_id = conversation.get('id', 'unknown')
     conversation_title = conversation.get('title', 'Untitled')
     
     # The mapping contains nodes with messages
-    mapping = conversation.get('mapping', {})
-    
-    for node_id, node in mapping.items():
+    for node_id, node in conversation.get('mapping', {}).items():
         message = node.get('message')
         
         if not message:
             continue
         
-        # Get message details
-        author = message.get('author', {})
-        role = author.get('role', 'unknown')
-        
-        content = message.get('content', {})
-        parts = content.get('parts', [])
-        
-        # Concatenate all parts
-        text = '\n'.join(part for part in parts if isinstance(part, str))
+        # Concatenate all text parts (non-string parts are attachments etc.)
+        parts = (message.get('content') or _EMPTY).get('parts') or ()
+        text = '\n'.join([part for part in parts if type(part) is str])
         
-        if not text.strip():
+        if not text or text.isspace():
             continue
         
         create_time = message.get('create_time')
         
-        messages.append({
+        append({
             'conversation_id': conversation_id,
             'conversation_title': conversation_title,
             'message_id': message.get('id', node_id),
-            'role': role,
+            'role': (message.get('author') or _EMPTY).get('role', 'unknown'),
             'text': text,
             'timestamp': datetime.fromtimestamp(create_time) if create_time else None
         })
@@ -114,19 +115,30 @@ def extract_messages_from_conversation(conversation: dict) -> list[dict]:
     return messages
 
 
+# Namespace for import source IDs; fixed, so derived once rather than per message
+CHATGPT_IMPORT_NAMESPACE = uuid5(NAMESPACE_DNS, "helionyx.chatgpt.import")
+
+
 def generate_idempotent_source_id(conversation_id: str, message_id: str) -> str:
     """Generate deterministic source ID for idempotency."""
     # Use UUID5 to create deterministic ID from conversation + message ID
-    namespace = uuid5(NAMESPACE_DNS, "helionyx.chatgpt.import")
-    return str(uuid5(namespace, f"{conversation_id}:{message_id}"))
+    return str(uuid5(CHATGPT_IMPORT_NAMESPACE, f"{conversation_id}:{message_id}"))
 
 
 async def import_messages(
     messages: list[dict],
     ingestion_service: IngestionService,
-    extraction_service: ExtractionService
+    extraction_service: ExtractionService,
+    concurrency: int = 8
 ) -> dict:
-    """Import messages and trigger extraction."""
+    """Import messages and trigger extraction.
+    
+    Messages are ingested one at a time in dump order, so the event log records
+    an import the same way on every run. Extraction (the slow LLM call) runs on
+    a fixed pool of ``concurrency`` workers fed through a bounded queue; the
+    extracted-object events of different messages may therefore interleave in
+    completion order, but each message's own objects stay in order.
+    """
     
     stats = {
         'total': len(messages),
@@ -135,52 +147,85 @@ async def import_messages(
         'extracted': 0,
         'errors': 0
     }
+    processed = 0
+    concurrency = max(1, concurrency)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
     
-    logger.info(f"Starting import of {stats['total']} messages...")
+    logger.info(f"Starting import of {stats['total']} messages (concurrency {concurrency})...")
     
-    for i, msg in enumerate(messages, 1):
-        try:
-            # Generate idempotent source ID
-            source_id = generate_idempotent_source_id(
-                msg['conversation_id'],
-                msg['message_id']
-            )
-            
-            # Build message content with context
-            content = f"[ChatGPT {msg['role']}] {msg['text']}"
-            
-            # Ingest message
-            message_event_id = await ingestion_service.ingest_message(
-                content=content,
-                source=SourceType.CHATGPT_DUMP,
-                source_id=source_id,
-                author=f"chatgpt-{msg['role']}"
-            )
-            
-            if message_event_id:
-                stats['imported'] += 1
+    def message_done():
+        nonlocal processed
+        # Progress update every 10 messages
+        processed += 1
+        if processed % 10 == 0:
+            logger.info(f"Progress: {processed}/{stats['total']} messages processed")
+    
+    async def extract_worker():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            i, message_event_id = item
+            try:
+                extracted_ids = await extraction_service.extract_from_message(message_event_id)
+                stats['extracted'] += len(extracted_ids)
                 
-                # Only extract from user messages (not assistant responses)
-                if msg['role'] == 'user':
-                    # Trigger extraction
-                    extracted_ids = await extraction_service.extract_from_message(message_event_id)
-                    stats['extracted'] += len(extracted_ids)
-                    
-                    if extracted_ids:
-                        logger.info(f"Message {i}/{stats['total']}: Extracted {len(extracted_ids)} objects")
-                else:
-                    logger.debug(f"Message {i}/{stats['total']}: Skipped extraction (assistant message)")
-            else:
+                if extracted_ids:
+                    logger.info(f"Message {i}/{stats['total']}: Extracted {len(extracted_ids)} objects")
+            except Exception as e:
+                stats['errors'] += 1
+                logger.error(f"Error processing message {i}: {e}", exc_info=True)
+            message_done()
+    
+    workers = [asyncio.create_task(extract_worker()) for _ in range(concurrency)]
+    try:
+        for i, msg in enumerate(messages, 1):
+            try:
+                # Generate idempotent source ID
+                source_id = generate_idempotent_source_id(
+                    msg['conversation_id'],
+                    msg['message_id']
+                )
+                
+                # Build message content with context
+                content = f"[ChatGPT {msg['role']}] {msg['text']}"
+                
+                # Ingest message
+                message_event_id = await ingestion_service.ingest_message(
+                    content=content,
+                    source=SourceType.CHATGPT_DUMP,
+                    source_id=source_id,
+                    author=f"chatgpt-{msg['role']}"
+                )
+            except Exception as e:
+                stats['errors'] += 1
+                logger.error(f"Error processing message {i}: {e}", exc_info=True)
+                message_done()
+                continue
+            
+            if not message_event_id:
                 stats['skipped'] += 1
                 logger.debug(f"Message {i}/{stats['total']}: Skipped (duplicate)")
+                message_done()
+                continue
+            
+            stats['imported'] += 1
             
-            # Progress update every 10 messages
-            if i % 10 == 0:
-                logger.info(f"Progress: {i}/{stats['total']} messages processed")
+            # Only extract from user messages (not assistant responses)
+            if msg['role'] == 'user':
+                # Waits while the workers are busy, bounding the queued messages
+                await queue.put((i, message_event_id))
+            else:
+                logger.debug(f"Message {i}/{stats['total']}: Skipped extraction (assistant message)")
+                message_done()
         
-        except Exception as e:
-            stats['errors'] += 1
-            logger.error(f"Error processing message {i}: {e}", exc_info=True)
+        # One stop marker per worker, queued behind the remaining messages
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            worker.cancel()
     
     return stats
 
@@ -206,8 +251,13 @@ async def main():
         for conv in data['conversations']:
             messages = extract_messages_from_conversation(conv)
             all_messages.extend(messages)
+        conversation_count = len(data['conversations'])
         
-        logger.info(f"Extracted {len(all_messages)} messages from {len(data['conversations'])} conversations")
+        # Release the parsed export before the long-running import; messages
+        # only keep the fields they need.
+        del data
+        
+        logger.info(f"Extracted {len(all_messages)} messages from {conversation_count} conversations")
         
         # Initialize services
         config = Config()
@@ -223,7 +273,10 @@ async def main():
         extraction_service = ExtractionService(event_store, llm_service)
         
         # Import messages
-        stats = await import_messages(all_messages, ingestion_service, extraction_service)
+        concurrency = int(os.getenv('IMPORT_CONCURRENCY', '8'))
+        stats = await import_messages(
+            all_messages, ingestion_service, extraction_service, concurrency=concurrency
+        )
         
         # Print summary
         logger.info("=== Import Complete ===")
@@ -243,4 +296,4 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    run(main())
@@ -25,10 +25,9 @@ Example:
     Done! Check events with: python scripts/view_events.py
 """
 
-import asyncio
+import secrets
 import sys
 from pathlib import Path
-from datetime import datetime
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -36,6 +35,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.contracts import SourceType
 from services.event_store.file_store import FileEventStore
 from services.ingestion.service import IngestionService
+from shared.common.runner import run
 
 
 async def main():
@@ -72,21 +72,28 @@ async def main():
     event_store = FileEventStore("./data/events")
     ingestion = IngestionService(event_store)
     
-    # Ingest each message
-    timestamp = datetime.utcnow().isoformat()
+    # Ingest all messages with a single append. Source IDs only need to be unique
+    # per session: the event itself already records when it was ingested.
+    session = secrets.token_hex(4)
     
-    for i, msg in enumerate(messages, 1):
-        try:
-            event_id = await ingestion.ingest_message(
-                content=msg,
-                source=SourceType.CLI,
-                source_id=f"cli-live-{timestamp}-{i}",
-                author="user",
-            )
-            print(f"✓ Message {i} ingested: {event_id}")
-        except Exception as e:
-            print(f"✗ Message {i} failed: {e}")
-            return 1
+    try:
+        event_ids = await ingestion.ingest_messages(
+            [
+                {
+                    "content": msg,
+                    "source": SourceType.CLI,
+                    "source_id": f"cli-live-{session}-{i}",
+                    "author": "user",
+                }
+                for i, msg in enumerate(messages, 1)
+            ]
+        )
+    except Exception as e:
+        print(f"✗ Ingestion failed: {e}")
+        return 1
+    
+    for i, event_id in enumerate(event_ids, 1):
+        print(f"✓ Message {i} ingested: {event_id}")
     
     print(f"\nDone! {len(messages)} messages ingested.")
     print("Next steps:")
@@ -98,5 +105,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run(main())
     sys.exit(exit_code)
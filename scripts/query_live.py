@@ -2,14 +2,14 @@
 """Query system state interactively.
 
 This script provides an interactive menu for querying todos, notes, and tracks
-with optional tag filtering. It rebuilds projections from the event log on
+with optional tag filtering. It catches projections up with the event log on
 startup to ensure data is current.
 
 Usage:
     python scripts/query_live.py
 
 The script will:
-1. Rebuild projections from event log
+1. Catch projections up with the event log
 2. Display system stats
 3. Present interactive menu for queries
 4. Format results in readable form
@@ -17,8 +17,8 @@ The script will:
 Example session:
     $ python scripts/query_live.py
     
-    Rebuilding projections...
-    ✓ Projections rebuilt
+    Updating projections from event log...
+    ✓ Projections up to date
     
     === System Stats ===
     Todos: 15 (5 pending, 3 urgent)
@@ -44,6 +44,7 @@ Example session:
 
 import asyncio
 import sys
+import threading
 from pathlib import Path
 
 # Add project root to path
@@ -51,6 +52,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from services.event_store.file_store import FileEventStore
 from services.query.service import QueryService
+from shared.common.runner import run
 
 
 def format_todo(todo):
@@ -95,6 +97,14 @@ def format_track(track):
     return "\n".join(lines)
 
 
+def print_items(items, formatter):
+    """Print formatted items, each followed by a blank line, in a single write."""
+    if not items:
+        print("  (none)")
+        return
+    sys.stdout.write("".join([f"{formatter(item)}\n\n" for item in items]))
+
+
 async def display_stats(query: QueryService):
     """Display system statistics."""
     stats = query.get_stats()
@@ -117,12 +127,7 @@ async def list_todos(query: QueryService, tag=None):
         print(f"\n📋 All Todos:\n")
         todos = await query.get_todos()
     
-    if not todos:
-        print("  (none)")
-    else:
-        for todo in todos:
-            print(format_todo(todo))
-            print()
+    print_items(todos, format_todo)
 
 
 async def list_notes(query: QueryService, tag=None):
@@ -134,12 +139,7 @@ async def list_notes(query: QueryService, tag=None):
         print(f"\n📝 All Notes:\n")
         notes = await query.get_notes()
     
-    if not notes:
-        print("  (none)")
-    else:
-        for note in notes:
-            print(format_note(note))
-            print()
+    print_items(notes, format_note)
 
 
 async def list_tracks(query: QueryService, tag=None):
@@ -151,12 +151,38 @@ async def list_tracks(query: QueryService, tag=None):
         print(f"\n📊 All Tracks:\n")
         tracks = await query.get_tracks()
     
-    if not tracks:
-        print("  (none)")
-    else:
-        for track in tracks:
-            print(format_track(track))
-            print()
+    print_items(tracks, format_track)
+
+
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+    
+    input() runs on a daemon thread rather than the default executor, so a
+    pending prompt never keeps the process alive after Ctrl+C.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def settle(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def read_line():
+        try:
+            result, error = input(prompt), None
+        except BaseException as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # Loop already closed
+    
+    threading.Thread(target=read_line, daemon=True).start()
+    return await future
 
 
 async def interactive_menu(query: QueryService):
@@ -174,27 +200,27 @@ async def interactive_menu(query: QueryService):
         print()
         
         try:
-            choice = input("Choice [1-8]: ").strip()
-        except (EOFError, KeyboardInterrupt):
+            choice = (await ainput("Choice [1-8]: ")).strip()
+        except (EOFError, KeyboardInterrupt, asyncio.CancelledError):
             print("\n\nGoodbye!")
             return
         
         if choice == "1":
             await list_todos(query)
         elif choice == "2":
-            tag = input("Enter tag: ").strip()
+            tag = (await ainput("Enter tag: ")).strip()
             if tag:
                 await list_todos(query, tag)
         elif choice == "3":
             await list_notes(query)
         elif choice == "4":
-            tag = input("Enter tag: ").strip()
+            tag = (await ainput("Enter tag: ")).strip()
             if tag:
                 await list_notes(query, tag)
         elif choice == "5":
             await list_tracks(query)
         elif choice == "6":
-            tag = input("Enter tag: ").strip()
+            tag = (await ainput("Enter tag: ")).strip()
             if tag:
                 await list_tracks(query, tag)
         elif choice == "7":
@@ -214,13 +240,13 @@ async def main():
     event_store = FileEventStore("./data/events")
     query = QueryService(event_store)
     
-    # Rebuild projections to ensure current data
-    print("Rebuilding projections from event log...")
+    # Catch projections up with the event log to ensure current data
+    print("Updating projections from event log...")
     try:
-        await query.rebuild_projections()
-        print("✓ Projections rebuilt\n")
+        await query.catch_up_projections()
+        print("✓ Projections up to date\n")
     except Exception as e:
-        print(f"✗ Error rebuilding projections: {e}")
+        print(f"✗ Error updating projections: {e}")
         return 1
     
     # Display initial stats
@@ -233,5 +259,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    try:
+        exit_code = run(main())
+    except KeyboardInterrupt:
+        exit_code = 130
     sys.exit(exit_code)
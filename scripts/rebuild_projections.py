@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """CLI tool to rebuild projections from event log."""
 
-import asyncio
 import logging
 import sys
 from pathlib import Path
@@ -11,6 +10,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from shared.common.config import Config
+from shared.common.runner import run
 from services.event_store.file_store import FileEventStore
 from services.query.service import QueryService
 
@@ -72,4 +72,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -3,6 +3,7 @@
 
 import asyncio
 import logging
+import signal
 import sys
 from pathlib import Path
 
@@ -12,13 +13,8 @@ sys.path.insert(0, str(project_root))
 
 from shared.common.config import Config
 from shared.common.logging import setup_logging
-from services.event_store.file_store import FileEventStore
-from services.ingestion.service import IngestionService
-from services.extraction.service import ExtractionService
-from services.extraction.openai_client import OpenAILLMService
-from services.extraction.mock_llm import MockLLMService
-from services.query.service import QueryService
-from services.adapters.telegram.bot import start_bot
+from shared.common.runner import run
+from services.bootstrap import build_services
 
 
 async def main():
@@ -38,41 +34,13 @@ async def main():
         logger.error("Please set TELEGRAM_BOT_TOKEN in .env")
         sys.exit(1)
     
-    logger.info("Initializing services...")
-    
-    # Initialize services
-    event_store = FileEventStore(data_dir=config.EVENT_STORE_PATH)
-    
-    # Initialize LLM service (OpenAI or Mock)
-    if config.OPENAI_API_KEY:
-        logger.info(f"Using OpenAI LLM service (model: {config.OPENAI_MODEL})")
-        llm_service = OpenAILLMService(
-            event_store=event_store,
-            api_key=config.OPENAI_API_KEY,
-            model=config.OPENAI_MODEL,
-            max_tokens=config.OPENAI_MAX_TOKENS,
-            temperature=config.OPENAI_TEMPERATURE,
-            max_retries=config.LLM_MAX_RETRIES,
-            retry_base_delay=config.LLM_RETRY_BASE_DELAY,
-        )
-    else:
-        logger.warning("No OpenAI API key found - using Mock LLM service")
-        logger.warning("Set OPENAI_API_KEY in .env for real LLM extraction")
-        llm_service = MockLLMService(event_store=event_store)
+    # Imported only once the configuration is known to be usable
+    from services.adapters.telegram.bot import start_bot
     
-    ingestion_service = IngestionService(event_store)
-    extraction_service = ExtractionService(event_store, llm_service)
-    query_service = QueryService(event_store)
-    
-    # Rebuild projections on startup
-    logger.info("Rebuilding projections...")
-    await query_service.rebuild_projections()
+    logger.info("Initializing services...")
     
-    services = {
-        'ingestion': ingestion_service,
-        'extraction': extraction_service,
-        'query': query_service,
-    }
+    # Initialize services (same graph as the API)
+    services = build_services(config)
     
     # Start bot
     logger.info(f"Starting Telegram bot...")
@@ -84,8 +52,27 @@ async def main():
         logger.warning("  curl -s \"https://api.telegram.org/bot$TELEGRAM_BOT_TOKEN/getUpdates\" | jq '.result[-1].message.chat.id'")
     logger.info(f"Notifications enabled flag: {config.NOTIFICATIONS_ENABLED}")
     
+    # Stop cleanly on Ctrl+C / SIGTERM instead of unwinding from KeyboardInterrupt
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Not supported on Windows event loops; KeyboardInterrupt still applies
+            pass
+    
     try:
-        await start_bot(config.TELEGRAM_BOT_TOKEN, services, config)
+        # Bring projections up to date (no-op when the log is unchanged) while
+        # the bot connects to Telegram; both finish before polling starts
+        logger.info("Catching up projections...")
+        await start_bot(
+            config.TELEGRAM_BOT_TOKEN,
+            services,
+            config,
+            startup=services['query'].catch_up_projections,
+            stop_event=stop_event,
+        )
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
@@ -94,4 +81,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
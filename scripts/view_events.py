@@ -1,12 +1,64 @@
 #!/usr/bin/env python
 """View events from the event log."""
 
-import json
+import argparse
+import mmap
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+
+# Slice size for counting newlines in a mapped shard
+_COUNT_CHUNK = 1 << 20
+
+
+def scan_event_file(event_file: Path, n: int = 5) -> tuple[int, list[bytes]]:
+    """Count events in a shard and return its last ``n`` raw lines.
+    
+    The file is memory-mapped: the event count is a chunked newline count done in C,
+    and the last lines are located by searching backwards from the end, so no
+    Python-level loop runs over the whole file. The store never writes blank
+    lines, so every newline-terminated line is one event.
+    """
+    if event_file.stat().st_size == 0:
+        return 0, []
+    
+    with open(event_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        count = sum(
+            mm[pos:pos + _COUNT_CHUNK].count(b'\n') for pos in range(0, size, _COUNT_CHUNK)
+        )
+        end = size - 1
+        if mm[end] != ord('\n'):
+            # Trailing line without a newline yet (append in progress)
+            count += 1
+            end = size
+        
+        last_lines = []
+        while end > 0 and len(last_lines) < n:
+            start = mm.rfind(b'\n', 0, end) + 1
+            line = mm[start:end]
+            if line.strip():
+                last_lines.append(line)
+            end = start - 1
+    
+    last_lines.reverse()
+    return count, last_lines
+
+
 def main():
     """Display events from the log."""
+    parser = argparse.ArgumentParser(description="View events from the event log")
+    parser.add_argument(
+        "--tail",
+        type=int,
+        default=5,
+        metavar="N",
+        help="Number of most recent events to show per file (default: 5)",
+    )
+    args = parser.parse_args()
+    
     data_dir = Path("./data/events")
     
     if not data_dir.exists():
@@ -22,23 +74,27 @@ def main():
     print(f"Found {len(event_files)} event file(s)\n")
     
     total_events = 0
+    tail = max(0, args.tail)
+    
+    # Shards are independent, so scan them on a thread pool; map() keeps file order
+    with ThreadPoolExecutor() as pool:
+        scans = list(pool.map(lambda event_file: scan_event_file(event_file, n=tail), event_files))
     
-    for event_file in event_files:
-        with open(event_file) as f:
-            events = [json.loads(line) for line in f]
-            total_events += len(events)
-            
-            print(f"=== {event_file.name} ({len(events)} events) ===\n")
-            
-            for event in events[-5:]:  # Show last 5 events from each file
-                print(f"[{event['timestamp']}] {event['event_type']}")
-                if event['event_type'] == 'message_ingested':
-                    print(f"  Source: {event['source']}")
-                    print(f"  Content: {event['content'][:80]}...")
-                elif event['event_type'] == 'object_extracted':
-                    print(f"  Object: {event['object_type']}")
-                    print(f"  Data: {event['object_data'].get('title', 'N/A')[:80]}")
-                print()
+    for event_file, (count, last_lines) in zip(event_files, scans):
+        total_events += count
+        
+        print(f"=== {event_file.name} ({count} events) ===\n")
+        
+        # Decode only the events that are displayed
+        for event in map(orjson.loads, last_lines):  # Show last N events from each file
+            print(f"[{event['timestamp']}] {event['event_type']}")
+            if event['event_type'] == 'message_ingested':
+                print(f"  Source: {event['source']}")
+                print(f"  Content: {event['content'][:80]}...")
+            elif event['event_type'] == 'object_extracted':
+                print(f"  Object: {event['object_type']}")
+                print(f"  Data: {event['object_data'].get('title', 'N/A')[:80]}")
+            print()
     
     print(f"Total events across all files: {total_events}")
 
@@ -1,6 +1,9 @@
 """Main Telegram bot setup and configuration."""
 
+import asyncio
 import logging
+from typing import Awaitable, Callable, Optional
+
 from telegram import Update
 from telegram.ext import (
     Application,
@@ -69,7 +72,13 @@ def create_application(bot_token: str, services: dict, cfg) -> Application:
     return application
 
 
-async def start_bot(bot_token: str, services: dict, cfg):
+async def start_bot(
+    bot_token: str,
+    services: dict,
+    cfg,
+    startup: Optional[Callable[[], Awaitable]] = None,
+    stop_event: Optional[asyncio.Event] = None,
+):
     """
     Start the Telegram bot.
 
@@ -77,15 +86,28 @@ async def start_bot(bot_token: str, services: dict, cfg):
         bot_token: Telegram bot token
         services: Dict with 'ingestion', 'extraction', 'query' services
         cfg: Configuration object
+        startup: Optional factory for local startup work (e.g. projection
+            catch-up), started once the application is built and run concurrently
+            with the network-bound application initialization. Both finish before
+            the bot starts handling updates.
+        stop_event: Optional event that stops the bot when set, including while
+            it is still starting up. Without one the bot runs until its task is
+            cancelled.
     """
 
     logger.info("Starting Telegram bot...")
 
+    if stop_event is None:
+        stop_event = asyncio.Event()
+
     # Create application
     application = create_application(bot_token, services, cfg)
 
     # Initialize and start application
-    await application.initialize()
+    if not await _initialize(application, startup, stop_event):
+        logger.info("Stopped during startup")
+        await application.shutdown()
+        return
     await application.start()
 
     # Start notification scheduler as background task if enabled
@@ -109,11 +131,9 @@ async def start_bot(bot_token: str, services: dict, cfg):
     # Keep running until interrupted
     logger.info("Bot is running. Press Ctrl+C to stop.")
     try:
-        import asyncio
-
-        # Keep the bot running
-        while True:
-            await asyncio.sleep(1)
+        # Idle without waking up until asked to stop
+        await stop_event.wait()
+        logger.info("Stopping bot...")
     except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("Stopping bot...")
     finally:
@@ -121,3 +141,49 @@ async def start_bot(bot_token: str, services: dict, cfg):
         await application.updater.stop()
         await application.stop()
         await application.shutdown()
+
+
+async def _initialize(
+    application: Application,
+    startup: Optional[Callable[[], Awaitable]],
+    stop_event: asyncio.Event,
+) -> bool:
+    """
+    Initialize the application alongside the optional startup work.
+
+    Returns False, with the unfinished work cancelled, if stop_event is set
+    before both complete. If initialization fails, the startup work still runs
+    to completion rather than being cut off part way before the error is raised.
+    """
+    init_task = asyncio.ensure_future(application.initialize())
+    tasks = [init_task]
+    if startup is not None:
+        tasks.append(asyncio.ensure_future(startup()))
+    stop_task = asyncio.ensure_future(stop_event.wait())
+
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending | {stop_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if stop_task in done:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                return False
+            pending.discard(stop_task)
+            if init_task in done and init_task.exception() is not None:
+                await asyncio.gather(*pending, return_exceptions=True)
+                raise init_task.exception()
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    finally:
+        stop_task.cancel()
+
+    # Surface a failure of the startup work itself
+    for task in tasks:
+        task.result()
+    return True
@@ -2,12 +2,17 @@
 
 import logging
 import asyncio
+import random
+from datetime import timedelta
 from telegram import Update
 from telegram.ext import ContextTypes
 from telegram.error import RetryAfter, TimedOut
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for the timeout backoff between send attempts, in seconds
+MAX_RETRY_BACKOFF = 30.0
+
 
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Global error handler."""
@@ -21,6 +26,11 @@ async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
 
+def _retry_delay(base: float) -> float:
+    """Add up to 25% random jitter so concurrent senders do not retry in lockstep."""
+    return base + random.uniform(0, base * 0.25)
+
+
 async def send_with_retry(bot, chat_id: int, text: str, max_retries: int = 3, **kwargs):
     """Send message with retry on rate limit."""
 
@@ -30,14 +40,18 @@ async def send_with_retry(bot, chat_id: int, text: str, max_retries: int = 3, **
 
         except RetryAfter as e:
             if attempt < max_retries - 1:
-                logger.warning(f"Rate limited. Waiting {e.retry_after}s")
-                await asyncio.sleep(e.retry_after)
+                retry_after = e.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                logger.warning(f"Rate limited. Waiting {retry_after}s")
+                # Never retry earlier than Telegram asked; jitter only adds to it
+                await asyncio.sleep(_retry_delay(retry_after))
             else:
                 raise
 
         except TimedOut as e:
             if attempt < max_retries - 1:
                 logger.warning(f"Timeout. Retrying...")
-                await asyncio.sleep(2**attempt)
+                await asyncio.sleep(_retry_delay(min(2**attempt, MAX_RETRY_BACKOFF)))
             else:
                 raise
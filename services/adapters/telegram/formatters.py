@@ -1,8 +1,22 @@
 """Message formatters for Telegram display."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
+_TODO_PRIORITY_ORDER = {"urgent": 0, "high": 1, "medium": 2, "low": 3}
+_TODO_PRIORITY_ICONS = {"urgent": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}
+_TODO_PRIORITY_HEADERS = {
+    priority: f"\n{icon} *{priority.upper()}*" for priority, icon in _TODO_PRIORITY_ICONS.items()
+}
+_TODO_PRIORITY_LABELS = {"urgent": "Urgent", "high": "High", "medium": "Medium", "low": "Low"}
+_TASK_PRIORITY_ICONS = {"p0": "🔴", "p1": "🟠", "p2": "🟡", "p3": "🟢"}
+_TRACK_STATUS_ICONS = {"completed": "✅", "paused": "⏸"}
+
+
+def _todo_priority_rank(todo: dict) -> int:
+    return _TODO_PRIORITY_ORDER[todo.get("priority", "medium")]
+
 
 def format_todos_list(todos: list[dict]) -> str:
     """Format todo list for Telegram display."""
@@ -10,33 +24,25 @@ def format_todos_list(todos: list[dict]) -> str:
     if not todos:
         return "No todos found."
 
-    # Group by priority
-    by_priority = {"urgent": [], "high": [], "medium": [], "low": []}
-
-    for todo in todos:
-        priority = todo.get("priority", "medium")
-        by_priority[priority].append(todo)
-
     # Build message
     lines = [f"📋 *Your Todos* ({len(todos)})\n"]
 
-    priority_icons = {"urgent": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}
-
-    for priority in ["urgent", "high", "medium", "low"]:
-        items = by_priority[priority]
-        if not items:
-            continue
-
-        icon = priority_icons[priority]
-        lines.append(f"\n{icon} *{priority.upper()}*")
+    # A stable sort groups todos by priority while keeping their order within each
+    # group, so one walk emits a header whenever the priority changes.
+    current = None
+    now = datetime.now().astimezone()
+    for todo in sorted(todos, key=_todo_priority_rank):
+        priority = todo.get("priority", "medium")
+        if priority != current:
+            current = priority
+            lines.append(_TODO_PRIORITY_HEADERS[priority])
 
-        for todo in items:
-            title = todo["title"]
-            due = format_due_date(todo.get("due_date"))
-            due_text = f"\n  📅 {due}" if due else ""
-            status = todo.get("status", "pending")
-            status_icon = "✅" if status == "completed" else ""
-            lines.append(f"• {status_icon}{title}{due_text}")
+        title = todo["title"]
+        due = format_due_date(todo.get("due_date"), now)
+        due_text = f"\n  📅 {due}" if due else ""
+        status = todo.get("status", "pending")
+        status_icon = "✅" if status == "completed" else ""
+        lines.append(f"• {status_icon}{title}{due_text}")
 
     return "\n".join(lines)
 
@@ -78,39 +84,64 @@ def format_tracks_list(tracks: list[dict]) -> str:
     for track in tracks:
         subject = track.get("subject", "Unknown")
         status = track.get("status", "active")
-        status_icon = "✅" if status == "completed" else "⏸" if status == "paused" else "👁"
+        status_icon = _TRACK_STATUS_ICONS.get(status, "👁")
 
         lines.append(f"• {status_icon} {subject}")
 
     return "\n".join(lines)
 
 
-def format_due_date(due_date_str: Optional[str]) -> Optional[str]:
-    """Format due date for display."""
-    if not due_date_str:
-        return None
+@lru_cache(maxsize=1024)
+def _parse_due_date(due_date_str: str) -> Optional[datetime]:
+    """
+    Parse an ISO due date, or return None if it is malformed.
 
+    Cached because the same dates recur across lists and digests; caching the
+    None result also keeps repeated bad strings from raising on every call.
+    """
     try:
-        # Handle various date formats
-        if "T" in due_date_str:
-            due = datetime.fromisoformat(due_date_str.replace("Z", "+00:00"))
-        else:
-            due = datetime.fromisoformat(due_date_str)
-
-        now = datetime.now(due.tzinfo) if due.tzinfo else datetime.now()
-
-        if due.date() == now.date():
-            return "Today"
-        elif due.date() == (now + timedelta(days=1)).date():
-            return "Tomorrow"
-        elif due < now:
-            days_ago = (now - due).days
-            return f"{days_ago}d overdue"
-        else:
-            return due.strftime("%b %d")
+        return datetime.fromisoformat(due_date_str.replace("Z", "+00:00"))
     except (ValueError, AttributeError):
+        return None
+
+
+def format_due_date(due_date_str: Optional[str], now: Optional[datetime] = None) -> Optional[str]:
+    """
+    Format due date for display.
+
+    ``now`` is an aware current time; list formatters take it once and pass it
+    to every item. Defaults to the current local time.
+    """
+    if not due_date_str:
+        return None
+
+    due = _parse_due_date(due_date_str)
+    if due is None:
         return due_date_str
 
+    # Only the parse is cached: the relative label depends on the current time
+    return _format_due_datetime(due, now or datetime.now().astimezone())
+
+
+def _format_due_datetime(due: datetime, now: datetime) -> str:
+    """
+    Format a due datetime relative to ``now``, an aware current time.
+
+    Callers formatting many items take ``now`` once and pass it to each call.
+    """
+    # Compare in the due date's own timezone, or in local time for naive values
+    now = now.astimezone(due.tzinfo) if due.tzinfo else now.replace(tzinfo=None)
+
+    if due.date() == now.date():
+        return "Today"
+    elif due.date() == (now + timedelta(days=1)).date():
+        return "Tomorrow"
+    elif due < now:
+        days_ago = (now - due).days
+        return f"{days_ago}d overdue"
+    else:
+        return due.strftime("%b %d")
+
 
 def format_tasks_list(tasks: list[dict]) -> str:
     """Format task list for Telegram display."""
@@ -119,7 +150,6 @@ def format_tasks_list(tasks: list[dict]) -> str:
         return "No tasks found."
 
     lines = [f"🧩 *Your Tasks* ({len(tasks)})\n"]
-    priority_icons = {"p0": "🔴", "p1": "🟠", "p2": "🟡", "p3": "🟢"}
 
     for task in tasks[:20]:
         task_id = task.get("task_id", "")
@@ -127,7 +157,7 @@ def format_tasks_list(tasks: list[dict]) -> str:
         title = task.get("title", "Untitled")
         status = task.get("status", "open")
         priority = task.get("priority", "p2")
-        priority_icon = priority_icons.get(priority, "⚪")
+        priority_icon = _TASK_PRIORITY_ICONS.get(priority, "⚪")
         stale_icon = " ⚠️" if task.get("is_stale") else ""
         lines.append(f"• `{short_id}` {priority_icon} *{title}* ({status}){stale_icon}")
 
@@ -149,7 +179,7 @@ def format_reminder(todo: dict) -> str:
 {todo['title']}
 
 📅 Due: {due}
-Priority: {priority.capitalize()}
+Priority: {_TODO_PRIORITY_LABELS.get(priority) or priority.capitalize()}
     """
 
     return message.strip()
@@ -165,12 +195,9 @@ def format_daily_summary(stats: dict, todos: list[dict]) -> str:
     overdue = []
     for todo in todos:
         if todo.get("due_date"):
-            try:
-                due_date = datetime.fromisoformat(todo["due_date"].replace("Z", "+00:00"))
-                if due_date < now:
-                    overdue.append(todo)
-            except (ValueError, AttributeError):
-                pass
+            due_date = _parse_due_date(todo["due_date"])
+            if due_date is not None and due_date < now:
+                overdue.append(todo)
 
     message = f"""
 📊 *Daily Summary* - {today}
@@ -184,18 +211,19 @@ def format_daily_summary(stats: dict, todos: list[dict]) -> str:
     """
 
     if overdue:
-        message += "\n\n⚠️ *Overdue Items*"
-        for todo in overdue[:3]:  # Show max 3
-            message += f"\n• {todo['title']}"
+        lines = [message, "\n⚠️ *Overdue Items*"]
+        lines.extend(f"• {todo['title']}" for todo in overdue[:3])  # Show max 3
         if len(overdue) > 3:
-            message += f"\n• ... and {len(overdue) - 3} more"
+            lines.append(f"• ... and {len(overdue) - 3} more")
+        message = "\n".join(lines)
 
     return message.strip()
 
 
 def format_task_urgent_reminder(item: dict) -> str:
     """Format urgent task reminder from attention candidate item."""
-    due = format_due_date(item.get("due_at").isoformat() if item.get("due_at") else None)
+    due_at = item.get("due_at")
+    due = _format_due_datetime(due_at, datetime.now().astimezone()) if due_at else None
     title = item.get("title", "Untitled task")
     score = item.get("urgency_score", 0)
     explanation = item.get("urgency_explanation", "")
@@ -230,8 +258,10 @@ def format_attention_daily_digest(payload: dict) -> str:
     if not due_72h:
         lines.append("• None")
     else:
+        now = datetime.now().astimezone()
         for item in due_72h[:5]:
-            due = format_due_date(item.get("due_at").isoformat() if item.get("due_at") else None)
+            due_at = item.get("due_at")
+            due = _format_due_datetime(due_at, now) if due_at else None
             lines.append(f"• {item.get('title', 'Untitled')} ({due or 'due soon'})")
 
     lines.append("\n*Stale cleanup candidate*")
@@ -255,8 +285,10 @@ def format_attention_weekly_digest(payload: dict) -> str:
     if not due_this_week:
         lines.append("• None")
     else:
+        now = datetime.now().astimezone()
         for item in due_this_week[:10]:
-            due = format_due_date(item.get("due_at").isoformat() if item.get("due_at") else None)
+            due_at = item.get("due_at")
+            due = _format_due_datetime(due_at, now) if due_at else None
             lines.append(f"• {item.get('title', 'Untitled')} ({due or 'this week'})")
 
     lines.append("\n*High priority without due date*")
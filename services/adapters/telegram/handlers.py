@@ -1,5 +1,6 @@
 """Command handlers for Telegram bot."""
 
+import functools
 import logging
 from datetime import datetime
 
@@ -22,6 +23,28 @@ LEGACY_TODO_STATUS_MAP = {
     "completed": "done",
 }
 
+# Accepted status arguments, in the order they are listed back to the user
+_TASK_STATUSES = ("open", "blocked", "in_progress", "done", "cancelled", "snoozed")
+_TODO_STATUSES = (*LEGACY_TODO_STATUS_MAP, *_TASK_STATUSES)
+_TASK_STATUS_SET = frozenset(_TASK_STATUSES)
+_TODO_STATUS_SET = frozenset(_TODO_STATUSES)
+_TASK_STATUS_OPTIONS = ", ".join(_TASK_STATUSES)
+_TODO_STATUS_OPTIONS = ", ".join(_TODO_STATUSES)
+
+
+def _reply_on_error(handler):
+    """Log a command handler's unexpected errors and reply with a generic apology."""
+
+    @functools.wraps(handler)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        try:
+            return await handler(update, context)
+        except Exception as e:
+            logger.error(f"Error in {handler.__name__}: {e}", exc_info=True)
+            await update.message.reply_text("❌ Sorry, something went wrong. Please try again.")
+
+    return wrapper
+
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Welcome message and setup verification."""
@@ -78,6 +101,7 @@ Tip: You can also send plain messages and Helionyx will extract objects automati
     await update.message.reply_text(help_text.strip())
 
 
+@_reply_on_error
 async def todos_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Legacy alias for canonical task listing."""
 
@@ -87,94 +111,71 @@ async def todos_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     task_status = LEGACY_TODO_STATUS_MAP.get(status, status)
 
     # Validate status against canonical task statuses (plus legacy aliases)
-    valid_statuses = [
-        "pending",
-        "completed",
-        "open",
-        "blocked",
-        "in_progress",
-        "done",
-        "cancelled",
-        "snoozed",
-    ]
-    if status and task_status not in valid_statuses:
+    if status and task_status not in _TODO_STATUS_SET:
         await update.message.reply_text(
-            f"❌ Invalid status: {status}\n" f"Valid options: {', '.join(valid_statuses)}"
+            f"❌ Invalid status: {status}\n" f"Valid options: {_TODO_STATUS_OPTIONS}"
         )
         return
 
-    try:
-        tasks = await task_service.list_tasks(status=task_status)
-
-        if not tasks:
-            status_text = f" ({status})" if status else ""
-            await update.message.reply_text(f"No tasks found{status_text}.")
-            return
+    tasks = await task_service.list_tasks(status=task_status)
 
-        await update.message.reply_text(
-            "ℹ️ /todos is a legacy alias. Showing canonical tasks.",
-        )
-        formatted = format_tasks_list(tasks)
-        await update.message.reply_text(formatted, parse_mode="Markdown")
+    if not tasks:
+        status_text = f" ({status})" if status else ""
+        await update.message.reply_text(f"No tasks found{status_text}.")
+        return
 
-    except Exception as e:
-        logger.error(f"Error in todos_command: {e}", exc_info=True)
-        await update.message.reply_text("❌ Sorry, something went wrong. Please try again.")
+    await update.message.reply_text(
+        "ℹ️ /todos is a legacy alias. Showing canonical tasks.",
+    )
+    formatted = format_tasks_list(tasks)
+    await update.message.reply_text(formatted, parse_mode="Markdown")
 
 
+@_reply_on_error
 async def notes_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """List notes with optional search."""
 
     # Parse optional search argument
     search = " ".join(context.args) if context.args else None
 
-    try:
-        # Query service
-        notes = await query_service.get_notes(search=search)
+    # Query service
+    notes = await query_service.get_notes(search=search)
 
-        # Format response
-        if not notes:
-            search_text = f" matching '{search}'" if search else ""
-            await update.message.reply_text(f"No notes found{search_text}.")
-            return
-
-        # Format and send
-        formatted = format_notes_list(notes)
-        await update.message.reply_text(formatted, parse_mode="Markdown")
+    # Format response
+    if not notes:
+        search_text = f" matching '{search}'" if search else ""
+        await update.message.reply_text(f"No notes found{search_text}.")
+        return
 
-    except Exception as e:
-        logger.error(f"Error in notes_command: {e}", exc_info=True)
-        await update.message.reply_text("❌ Sorry, something went wrong. Please try again.")
+    # Format and send
+    formatted = format_notes_list(notes)
+    await update.message.reply_text(formatted, parse_mode="Markdown")
 
 
+@_reply_on_error
 async def tracks_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """List tracking items."""
 
-    try:
-        # Query service
-        tracks = await query_service.get_tracks()
-
-        # Format response
-        if not tracks:
-            await update.message.reply_text("No tracking items found.")
-            return
+    # Query service
+    tracks = await query_service.get_tracks()
 
-        # Format and send
-        formatted = format_tracks_list(tracks)
-        await update.message.reply_text(formatted, parse_mode="Markdown")
+    # Format response
+    if not tracks:
+        await update.message.reply_text("No tracking items found.")
+        return
 
-    except Exception as e:
-        logger.error(f"Error in tracks_command: {e}", exc_info=True)
-        await update.message.reply_text("❌ Sorry, something went wrong. Please try again.")
+    # Format and send
+    formatted = format_tracks_list(tracks)
+    await update.message.reply_text(formatted, parse_mode="Markdown")
 
 
+@_reply_on_error
 async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Display system statistics."""
 
-    try:
-        stats = query_service.get_stats()
+    stats = query_service.get_stats()
 
-        message = f"""
+    message = f"""
 📊 *Helionyx Statistics*
 
 *Objects*
@@ -186,37 +187,29 @@ async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 *System*
 • Events: {stats.get('total_events', 'N/A')}
 • Last rebuild: {stats.get('last_rebuild', 'Never')}
-        """
-
-        await update.message.reply_text(message.strip(), parse_mode="Markdown")
+    """
 
-    except Exception as e:
-        logger.error(f"Error in stats_command: {e}", exc_info=True)
-        await update.message.reply_text("❌ Sorry, something went wrong. Please try again.")
+    await update.message.reply_text(message.strip(), parse_mode="Markdown")
 
 
+@_reply_on_error
 async def tasks_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """List tasks with optional status filter."""
     status = context.args[0] if context.args else None
-    valid_statuses = ["open", "blocked", "in_progress", "done", "cancelled", "snoozed"]
 
-    if status and status not in valid_statuses:
+    if status and status not in _TASK_STATUS_SET:
         await update.message.reply_text(
-            f"❌ Invalid status: {status}\nValid options: {', '.join(valid_statuses)}"
+            f"❌ Invalid status: {status}\nValid options: {_TASK_STATUS_OPTIONS}"
         )
         return
 
-    try:
-        tasks = await task_service.list_tasks(status=status)
-        if not tasks:
-            suffix = f" ({status})" if status else ""
-            await update.message.reply_text(f"No tasks found{suffix}.")
-            return
-
-        await update.message.reply_text(format_tasks_list(tasks), parse_mode="Markdown")
-    except Exception as e:
-        logger.error(f"Error in tasks_command: {e}", exc_info=True)
-        await update.message.reply_text("❌ Sorry, something went wrong. Please try again.")
+    tasks = await task_service.list_tasks(status=status)
+    if not tasks:
+        suffix = f" ({status})" if status else ""
+        await update.message.reply_text(f"No tasks found{suffix}.")
+        return
+
+    await update.message.reply_text(format_tasks_list(tasks), parse_mode="Markdown")
 
 
 async def task_show_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -26,7 +26,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     try:
         # Ingest message
-        event_id = await ingestion_service.ingest_message(
+        message_event = await ingestion_service.ingest_message_event(
             content=message.text,
             source=SourceType.TELEGRAM,
             source_id=str(message.message_id),
@@ -38,11 +38,12 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 "telegram_chat_id": update.effective_chat.id,
             },
         )
+        event_id = message_event.event_id
 
         audit_logger.info("telegram_message_ingested event_id=%s", str(event_id))
 
         # Trigger extraction (synchronous for M1)
-        extracted_items = await extraction_service.extract_from_message(event_id)
+        extracted_items = await extraction_service.extract_from_event(message_event)
         audit_logger.info(
             "telegram_extraction_triggered event_id=%s extracted_count=%s",
             str(event_id),
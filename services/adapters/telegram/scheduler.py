@@ -3,7 +3,9 @@
 import logging
 import asyncio
 import json
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 from .formatters import (
     format_attention_daily_digest,
@@ -15,7 +17,9 @@ from services.query import database
 from services.attention import AttentionService
 from shared.contracts import ReminderSentEvent
 from services.control import ControlPolicy, ControlPolicyEvaluator
-from services.orchestration import OrchestrationRuntime
+
+if TYPE_CHECKING:
+    from services.orchestration import OrchestrationRuntime
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,42 @@ config = None
 db_conn = None
 
 
+@dataclass(frozen=True)
+class _ScheduleSettings:
+    """Timing settings the scheduler checks on every tick, resolved from ``config``."""
+
+    reminder_start: int
+    reminder_end: int
+    urgent_threshold: float
+    daily_hour: int
+    weekly_day: int
+    weekly_hour: int
+
+    @classmethod
+    def from_config(cls, cfg) -> "_ScheduleSettings":
+        return cls(
+            reminder_start=int(getattr(cfg, "REMINDER_WINDOW_START", 8)),
+            reminder_end=int(getattr(cfg, "REMINDER_WINDOW_END", 21)),
+            urgent_threshold=float(getattr(cfg, "ATTENTION_URGENT_THRESHOLD", 60.0)),
+            daily_hour=int(getattr(cfg, "DAILY_SUMMARY_HOUR", 20)),
+            weekly_day=int(getattr(cfg, "WEEKLY_SUMMARY_DAY", 0)),
+            weekly_hour=int(getattr(cfg, "WEEKLY_SUMMARY_HOUR", 9)),
+        )
+
+
+_settings_cache: tuple = (None, None)
+
+
+def _settings() -> _ScheduleSettings:
+    """Settings for the injected ``config``, resolved again only when it is replaced."""
+    global _settings_cache
+    cached_config, settings = _settings_cache
+    if settings is None or cached_config is not config:
+        settings = _ScheduleSettings.from_config(config)
+        _settings_cache = (config, settings)
+    return settings
+
+
 async def notification_scheduler(application):
     """Background task for checking and sending notifications."""
 
@@ -33,15 +73,57 @@ async def notification_scheduler(application):
 
     while True:
         try:
-            await check_and_send_daily_digest(application.bot)
-            await check_and_send_weekly_digest(application.bot)
-            await check_and_send_urgent_reminders(application.bot)
+            if _any_window_open(datetime.now()):
+                # Run the checks side by side so a slow send, with its retry
+                # back-off, does not hold back the other checks
+                results = await asyncio.gather(
+                    check_and_send_daily_digest(application.bot),
+                    check_and_send_weekly_digest(application.bot),
+                    check_and_send_urgent_reminders(application.bot),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"Error in notification scheduler: {result}", exc_info=result)
 
         except Exception as e:
             logger.error(f"Error in notification scheduler: {e}", exc_info=True)
 
-        # Sleep for 1 minute
-        await asyncio.sleep(60)
+        # Wake at the next minute boundary while a window is open, otherwise sleep
+        # straight through to the hour the next window opens
+        now = datetime.now()
+        await asyncio.sleep(max((_next_check_at(now) - now).total_seconds(), 1.0))
+
+
+def _any_window_open(now: datetime) -> bool:
+    """Whether any notification check can fire at ``now``."""
+    settings = _settings()
+    if settings.reminder_start <= now.hour <= settings.reminder_end:
+        return True
+
+    # Digests only go out in the first 5 minutes of their configured hour
+    if now.minute > 5:
+        return False
+    if now.hour == settings.daily_hour:
+        return True
+    return now.weekday() == settings.weekly_day and now.hour == settings.weekly_hour
+
+
+def _next_check_at(now: datetime) -> datetime:
+    """Next minute boundary at which ``_any_window_open`` holds."""
+    next_minute = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    if _any_window_open(next_minute):
+        return next_minute
+
+    # Every window opens on the hour, so wake at the earliest opening hour
+    settings = _settings()
+    candidates = []
+    for hour in (settings.reminder_start, settings.daily_hour, settings.weekly_hour):
+        candidate = next_minute.replace(hour=hour, minute=0)
+        if candidate < next_minute:
+            candidate += timedelta(days=1)
+        candidates.append(candidate)
+    return min(candidates)
 
 
 def _attention_service() -> AttentionService:
@@ -53,7 +135,11 @@ def _attention_service() -> AttentionService:
     )
 
 
-def _runtime() -> OrchestrationRuntime:
+def _runtime() -> "OrchestrationRuntime":
+    # Imported on first use: the runtime pulls in langgraph, which dominates bot
+    # startup time and is not needed until a notification is actually due.
+    from services.orchestration import OrchestrationRuntime
+
     allowed_workflows = set(
         filter(
             None,
@@ -114,30 +200,37 @@ async def check_and_send_urgent_reminders(bot):
 
     now = datetime.now()
     hour = now.hour
+    settings = _settings()
 
     # Only send reminders during reasonable hours
-    reminder_start = getattr(config, "REMINDER_WINDOW_START", 8)
-    reminder_end = getattr(config, "REMINDER_WINDOW_END", 21)
-
-    if hour < reminder_start or hour > reminder_end:
+    if hour < settings.reminder_start or hour > settings.reminder_end:
         return
 
     try:
-        threshold = float(getattr(config, "ATTENTION_URGENT_THRESHOLD", 60.0))
+        threshold = settings.urgent_threshold
         today = await _attention_service().get_today_attention(limit=20)
-        for item in today.get("top_actionable", []):
-            if float(item.get("urgency_score", 0.0)) < threshold:
-                continue
-
-            task_id = str(item.get("task_id"))
-            fingerprint = f"urgent:{task_id}:{item.get('urgency_score')}"
-            if db_conn and database.was_notification_sent_recently(
+        urgent = [
+            item
+            for item in today.get("top_actionable", [])
+            if float(item.get("urgency_score", 0.0)) >= threshold
+        ]
+
+        # Look up every candidate's recent reminders in one query
+        sent_fingerprints = (
+            database.get_recent_notification_fingerprints(
                 db_conn,
                 notification_type="task_urgent_reminder",
-                object_id=task_id,
+                object_ids=[str(item.get("task_id")) for item in urgent],
                 within_hours=12,
-                metadata_contains=fingerprint,
-            ):
+            )
+            if db_conn
+            else set()
+        )
+
+        for item in urgent:
+            task_id = str(item.get("task_id"))
+            fingerprint = f"urgent:{task_id}:{item.get('urgency_score')}"
+            if fingerprint in sent_fingerprints:
                 continue
 
             async def _execute_delivery() -> dict:
@@ -209,9 +302,7 @@ async def check_and_send_daily_digest(bot):
     now = datetime.now()
 
     # Check if it's digest time (default: 8 PM)
-    summary_hour = getattr(config, "DAILY_SUMMARY_HOUR", 20)
-
-    if now.hour != summary_hour or now.minute > 5:
+    if now.hour != _settings().daily_hour or now.minute > 5:
         # Only send during the configured hour, first 5 minutes
         return
 
@@ -265,8 +356,10 @@ async def check_and_send_daily_digest(bot):
 
         logger.info("Sent daily attention digest")
 
-        # Sleep extra to avoid sending multiple times in same hour
-        await asyncio.sleep(300)  # 5 minute cooldown
+        # The notification log dedupes later ticks; without it, sleep out the
+        # send window to avoid sending multiple times in same hour
+        if not db_conn:
+            await asyncio.sleep(300)  # 5 minute cooldown
 
     except Exception as e:
         logger.error(f"Error sending daily digest: {e}", exc_info=True)
@@ -275,10 +368,9 @@ async def check_and_send_daily_digest(bot):
 async def check_and_send_weekly_digest(bot):
     """Send weekly digest at configured day/hour."""
     now = datetime.now()
-    weekly_day = int(getattr(config, "WEEKLY_SUMMARY_DAY", 0))
-    weekly_hour = int(getattr(config, "WEEKLY_SUMMARY_HOUR", 9))
+    settings = _settings()
 
-    if now.weekday() != weekly_day or now.hour != weekly_hour or now.minute > 5:
+    if now.weekday() != settings.weekly_day or now.hour != settings.weekly_hour or now.minute > 5:
         return
 
     if db_conn and database.was_notification_sent_recently(
@@ -329,7 +421,8 @@ async def check_and_send_weekly_digest(bot):
             return
 
         logger.info("Sent weekly attention digest")
-        await asyncio.sleep(300)
+        if not db_conn:
+            await asyncio.sleep(300)
     except Exception as e:
         logger.error(f"Error sending weekly digest: {e}", exc_info=True)
 
@@ -419,7 +512,7 @@ async def run_orchestration_workflow(bot, workflow_name: str, dry_run: bool = Fa
         )
 
     if workflow == "urgent_reminder":
-        threshold = float(getattr(config, "ATTENTION_URGENT_THRESHOLD", 60.0))
+        threshold = _settings().urgent_threshold
         today = await _attention_service().get_today_attention(limit=20)
         candidate = None
         for item in today.get("top_actionable", []):
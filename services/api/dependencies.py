@@ -0,0 +1,19 @@
+"""Dependencies shared across API routers."""
+
+import asyncio
+
+from fastapi import Request
+
+
+async def projections_caught_up(request: Request) -> None:
+    """
+    Wait for the startup projection catch-up before serving projection reads.
+
+    The lifespan runs catch-up in the background so health checks answer while
+    it is in progress. Once it has finished this returns immediately; without a
+    lifespan there is no catch-up to wait for.
+    """
+    catch_up = getattr(request.app.state, "projections_catch_up", None)
+    if catch_up is not None:
+        # Shielded so a request that goes away does not cancel the shared task
+        await asyncio.shield(catch_up)
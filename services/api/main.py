@@ -9,17 +9,12 @@ import logging
 from contextlib import asynccontextmanager
 from typing import Optional
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from shared.common.config import Config
-from services.event_store.file_store import FileEventStore
-from services.ingestion.service import IngestionService
-from services.extraction.service import ExtractionService
-from services.extraction.openai_client import OpenAILLMService
-from services.extraction.mock_llm import MockLLMService
-from services.query.service import QueryService
-from services.task.service import TaskService
+from services.bootstrap import build_services
+from services.api.dependencies import projections_caught_up
 from services.api.routes import (
     attention,
     control_room,
@@ -39,6 +34,17 @@ services = {}
 telegram_task: Optional[asyncio.Task] = None
 
 
+async def _catch_up_projections(query_service) -> None:
+    """Bring projections up to date (no-op when the log is unchanged)."""
+    logger.info("Catching up projections...")
+    try:
+        await query_service.catch_up_projections()
+    except Exception as e:
+        logger.error(f"Projection catch-up failed: {e}", exc_info=True)
+        raise
+    logger.info("Projections up to date")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage service lifecycle - startup and shutdown."""
@@ -54,45 +60,15 @@ async def lifespan(app: FastAPI):
 
     logging.getLogger("helionyx.audit").info("config_loaded env=%s", config.ENV)
 
-    # Initialize event store
-    event_store = FileEventStore(data_dir=config.EVENT_STORE_PATH)
-    logger.info(f"Event store: {config.EVENT_STORE_PATH}")
-
-    # Initialize LLM service
-    if config.OPENAI_API_KEY:
-        logger.info(f"LLM: OpenAI ({config.OPENAI_MODEL})")
-        llm_service = OpenAILLMService(
-            event_store=event_store,
-            api_key=config.OPENAI_API_KEY,
-            model=config.OPENAI_MODEL,
-            max_tokens=config.OPENAI_MAX_TOKENS,
-            temperature=config.OPENAI_TEMPERATURE,
-            max_retries=config.LLM_MAX_RETRIES,
-            retry_base_delay=config.LLM_RETRY_BASE_DELAY,
-        )
-    else:
-        logger.warning("LLM: Mock (no OpenAI API key)")
-        llm_service = MockLLMService(event_store=event_store)
-
-    # Initialize domain services
-    ingestion_service = IngestionService(event_store)
-    extraction_service = ExtractionService(event_store, llm_service)
-    query_service = QueryService(event_store, db_path=config.PROJECTIONS_DB_PATH)
-    task_service = TaskService(event_store=event_store, query_service=query_service)
-    logger.info(f"Projections DB: {config.PROJECTIONS_DB_PATH}")
-
-    # Rebuild projections on startup
-    logger.info("Rebuilding projections...")
-    await query_service.rebuild_projections()
-    logger.info("Projections rebuilt")
-
-    # Store services globally
-    services["config"] = config
-    services["event_store"] = event_store
-    services["ingestion"] = ingestion_service
-    services["extraction"] = extraction_service
-    services["query"] = query_service
-    services["task"] = task_service
+    # Build the service graph and store it globally
+    services.update(build_services(config))
+    query_service = services["query"]
+    app.state.attention = services["attention"]
+
+    # Catch projections up in the background so the server answers health checks
+    # right away; projection-backed routes and the bot wait for it to finish
+    catch_up = asyncio.create_task(_catch_up_projections(query_service))
+    app.state.projections_catch_up = catch_up
 
     # Start Telegram bot if configured
     if config.TELEGRAM_BOT_TOKEN:
@@ -105,7 +81,12 @@ async def lifespan(app: FastAPI):
             from services.adapters.telegram.bot import start_bot
 
             telegram_task = asyncio.create_task(
-                start_bot(config.TELEGRAM_BOT_TOKEN, services, config)
+                start_bot(
+                    config.TELEGRAM_BOT_TOKEN,
+                    services,
+                    config,
+                    startup=lambda: asyncio.shield(catch_up),
+                )
             )
             logger.info("Telegram bot started")
             if config.TELEGRAM_CHAT_ID:
@@ -134,7 +115,17 @@ async def lifespan(app: FastAPI):
             pass
         logger.info("Telegram bot stopped")
 
+    # Stop an unfinished catch-up before its connection is closed
+    if not catch_up.done():
+        catch_up.cancel()
+    try:
+        await catch_up
+    except (asyncio.CancelledError, Exception):
+        pass
+    app.state.projections_catch_up = None
+
     # Close query service database connection
+    app.state.attention = None
     if "query" in services:
         logger.info("Closing database connection...")
         services["query"].close()
@@ -164,12 +155,26 @@ app.add_middleware(
 app.include_router(health.router, prefix="/health", tags=["health"])
 app.include_router(ingestion.router, prefix="/api/v1/ingest", tags=["ingestion"])
 app.include_router(extraction.router, prefix="/api/v1/extract", tags=["extraction"])
-app.include_router(query.router, prefix="/api/v1", tags=["query"])
-app.include_router(tasks.router, prefix="/api/v1/tasks", tags=["tasks"])
-app.include_router(control_room.router, prefix="/api/v1/control-room", tags=["control-room"])
-app.include_router(explorer.router, prefix="/api/v1/explorer", tags=["explorer"])
-app.include_router(lab.router, prefix="/api/v1/lab", tags=["lab"])
-app.include_router(attention.router, prefix="/attention", tags=["attention"])
+
+# Routers that read projections wait for the startup catch-up
+projections_ready = [Depends(projections_caught_up)]
+app.include_router(query.router, prefix="/api/v1", tags=["query"], dependencies=projections_ready)
+app.include_router(
+    tasks.router, prefix="/api/v1/tasks", tags=["tasks"], dependencies=projections_ready
+)
+app.include_router(
+    control_room.router,
+    prefix="/api/v1/control-room",
+    tags=["control-room"],
+    dependencies=projections_ready,
+)
+app.include_router(
+    explorer.router, prefix="/api/v1/explorer", tags=["explorer"], dependencies=projections_ready
+)
+app.include_router(lab.router, prefix="/api/v1/lab", tags=["lab"], dependencies=projections_ready)
+app.include_router(
+    attention.router, prefix="/attention", tags=["attention"], dependencies=projections_ready
+)
 
 
 @app.get("/")
@@ -179,5 +184,5 @@ async def root():
         "name": "Helionyx API",
         "version": "0.1.0",
         "status": "running",
-        "environment": services.get("config", Config.from_env()).ENV,
+        "environment": services.get("config", runtime_config).ENV,
     }
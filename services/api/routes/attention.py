@@ -3,31 +3,35 @@
 from pathlib import Path
 from collections.abc import Generator
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 
 from shared.common.config import Config
 from services.attention import AttentionService
+from services.bootstrap import build_attention_service
 from services.event_store.file_store import FileEventStore
 from services.query.service import QueryService
 
 router = APIRouter()
 
 
-def get_attention_service() -> Generator[AttentionService, None, None]:
-    """Get initialized attention service."""
+def get_attention_service(request: Request) -> Generator[AttentionService, None, None]:
+    """
+    Get initialized attention service.
+
+    Borrows the long-lived service built at application startup, so requests do
+    not reopen the projections database. Without one (the app was not started
+    through its lifespan), a service is built for the request and closed after.
+    """
+    shared = getattr(request.app.state, "attention", None)
+    if shared is not None:
+        yield shared
+        return
+
     config = Config.from_env()
     event_store = FileEventStore(data_dir=config.EVENT_STORE_PATH)
     query_service = QueryService(event_store, db_path=Path(config.PROJECTIONS_DB_PATH))
     try:
-        yield AttentionService(
-            event_store=event_store,
-            query_service=query_service,
-            enable_shadow_ranker=getattr(config, "SHADOW_RANKER_ENABLED", True),
-            shadow_confidence_threshold=getattr(config, "SHADOW_RANKER_CONFIDENCE_THRESHOLD", 0.6),
-            enable_bounded_personalization=getattr(
-                config, "ATTENTION_BOUNDED_PERSONALIZATION_ENABLED", False
-            ),
-        )
+        yield build_attention_service(config, event_store, query_service)
     finally:
         query_service.close()
 
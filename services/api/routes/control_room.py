@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, Query
 from shared.common.config import Config
 from shared.contracts import ControlRoomOverview, EventType, ReadinessCheck, ReadinessPayload
 from services.attention import AttentionService
+from services.bootstrap import build_attention_service
 from services.event_store.file_store import FileEventStore
 from services.query.service import QueryService
 from services.adapters.telegram import scheduler as telegram_scheduler
@@ -24,16 +25,7 @@ def get_control_room_services() -> Generator[tuple[Config, AttentionService], No
     event_store = FileEventStore(data_dir=config.EVENT_STORE_PATH)
     query_service = QueryService(event_store, db_path=Path(config.PROJECTIONS_DB_PATH))
     try:
-        attention_service = AttentionService(
-            event_store=event_store,
-            query_service=query_service,
-            enable_shadow_ranker=getattr(config, "SHADOW_RANKER_ENABLED", True),
-            shadow_confidence_threshold=getattr(config, "SHADOW_RANKER_CONFIDENCE_THRESHOLD", 0.6),
-            enable_bounded_personalization=getattr(
-                config, "ATTENTION_BOUNDED_PERSONALIZATION_ENABLED", False
-            ),
-        )
-        yield config, attention_service
+        yield config, build_attention_service(config, event_store, query_service)
     finally:
         query_service.close()
 
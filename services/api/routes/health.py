@@ -7,7 +7,7 @@ import os
 from pathlib import Path
 from typing import Dict, Any
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 from fastapi.responses import JSONResponse
 
 from shared.common.config import Config
@@ -29,12 +29,13 @@ async def health() -> Dict[str, Any]:
 
 
 @router.get("/ready")
-async def health_ready() -> JSONResponse:
+async def health_ready(request: Request) -> JSONResponse:
     """Readiness check - service can handle requests.
 
     Checks critical dependencies:
     - Event store path is accessible
     - Projections database path is accessible (parent directory exists)
+    - Startup projection catch-up has completed (when the app ran its lifespan)
 
     Returns:
         200 OK if all checks pass
@@ -62,6 +63,14 @@ async def health_ready() -> JSONResponse:
     if not projections_accessible:
         all_healthy = False
 
+    # Check startup projection catch-up (runs in the background after startup)
+    catch_up = getattr(request.app.state, "projections_catch_up", None)
+    if catch_up is not None:
+        complete = catch_up.done() and not catch_up.cancelled() and catch_up.exception() is None
+        checks["projections_catch_up"] = {"complete": complete}
+        if not complete:
+            all_healthy = False
+
     # Determine overall status
     response_status = status.HTTP_200_OK if all_healthy else status.HTTP_503_SERVICE_UNAVAILABLE
 
@@ -114,7 +114,7 @@ async def ingest_message(
         source_id = request.source_id or f"api-{uuid4().hex[:12]}"
 
         # Ingest message via service
-        event_id = await ingestion_service.ingest_message(
+        message_event = await ingestion_service.ingest_message_event(
             content=request.text,
             source=source_type,
             source_id=source_id,
@@ -122,6 +122,7 @@ async def ingest_message(
             conversation_id=request.conversation_id,
             metadata=request.metadata or {},
         )
+        event_id = message_event.event_id
 
         audit_logger.info(
             "message_ingested event_id=%s source=%s extract=%s",
@@ -131,7 +132,7 @@ async def ingest_message(
         )
 
         if extract:
-            extracted_items = await extraction_service.extract_from_message(event_id)
+            extracted_items = await extraction_service.extract_from_event(message_event)
             audit_logger.info(
                 "extraction_triggered_on_ingest event_id=%s extracted_count=%s",
                 str(event_id),
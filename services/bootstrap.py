@@ -0,0 +1,81 @@
+"""Service graph construction shared by the API and the standalone Telegram bot."""
+
+import logging
+
+from shared.common.config import Config
+from services.attention import AttentionService
+from services.event_store.file_store import FileEventStore
+from services.ingestion.service import IngestionService
+from services.extraction.service import ExtractionService
+from services.query.service import QueryService
+from services.task.service import TaskService
+
+logger = logging.getLogger(__name__)
+
+
+def build_llm_service(config: Config, event_store: FileEventStore):
+    """
+    Create the LLM service for extraction: OpenAI when a key is configured, else mock.
+
+    Each backend is imported only on the branch taken, so running without an
+    OpenAI key never pays for importing the openai client.
+    """
+    if config.OPENAI_API_KEY:
+        from services.extraction.openai_client import OpenAILLMService
+
+        logger.info(f"LLM: OpenAI ({config.OPENAI_MODEL})")
+        return OpenAILLMService(
+            event_store=event_store,
+            api_key=config.OPENAI_API_KEY,
+            model=config.OPENAI_MODEL,
+            max_tokens=config.OPENAI_MAX_TOKENS,
+            temperature=config.OPENAI_TEMPERATURE,
+            max_retries=config.LLM_MAX_RETRIES,
+            retry_base_delay=config.LLM_RETRY_BASE_DELAY,
+        )
+
+    from services.extraction.mock_llm import MockLLMService
+
+    logger.warning("LLM: Mock (no OpenAI API key)")
+    return MockLLMService(event_store=event_store)
+
+
+def build_attention_service(
+    config: Config, event_store: FileEventStore, query_service: QueryService
+) -> AttentionService:
+    """Create the attention service with the ranking options from configuration."""
+    return AttentionService(
+        event_store=event_store,
+        query_service=query_service,
+        enable_shadow_ranker=getattr(config, "SHADOW_RANKER_ENABLED", True),
+        shadow_confidence_threshold=getattr(config, "SHADOW_RANKER_CONFIDENCE_THRESHOLD", 0.6),
+        enable_bounded_personalization=getattr(
+            config, "ATTENTION_BOUNDED_PERSONALIZATION_ENABLED", False
+        ),
+    )
+
+
+def build_services(config: Config) -> dict:
+    """
+    Build the domain service graph from configuration.
+
+    Returns the services container consumed by the API routes and the Telegram
+    bot. Projections are not caught up here; callers decide when to do that.
+    """
+    event_store = FileEventStore(data_dir=config.EVENT_STORE_PATH)
+    logger.info(f"Event store: {config.EVENT_STORE_PATH}")
+
+    llm_service = build_llm_service(config, event_store)
+
+    query_service = QueryService(event_store, db_path=config.PROJECTIONS_DB_PATH)
+    logger.info(f"Projections DB: {config.PROJECTIONS_DB_PATH}")
+
+    return {
+        "config": config,
+        "event_store": event_store,
+        "ingestion": IngestionService(event_store),
+        "extraction": ExtractionService(event_store, llm_service),
+        "query": query_service,
+        "task": TaskService(event_store=event_store, query_service=query_service),
+        "attention": build_attention_service(config, event_store, query_service),
+    }
@@ -1,12 +1,119 @@
 """File-based event store implementation."""
 
-import json
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
 
-from shared.contracts import BaseEvent, EventType
+import orjson
+
+from shared.contracts import (
+    ArtifactRecordedEvent,
+    AttentionScoringComputedEvent,
+    BaseEvent,
+    DecisionRecordedEvent,
+    EventType,
+    FeatureSnapshotRecordedEvent,
+    FeedbackEvidenceRecordedEvent,
+    LabControlChangedEvent,
+    LabExperimentAppliedEvent,
+    LabExperimentRunEvent,
+    MessageIngestedEvent,
+    ModelScoreRecordedEvent,
+    ObjectExtractedEvent,
+    OrchestrationDeliveryAttemptedEvent,
+    OrchestrationDeliveryFailedEvent,
+    OrchestrationDeliverySucceededEvent,
+    OrchestrationNodeCompletedEvent,
+    OrchestrationNodeEnteredEvent,
+    OrchestrationNodeFallbackEvent,
+    OrchestrationNodeRetriedEvent,
+    OrchestrationPolicyAllowedEvent,
+    OrchestrationPolicyBlockedEvent,
+    OrchestrationPolicyEscalatedEvent,
+    OrchestrationRunCheckpointEvent,
+    OrchestrationRunFailedEvent,
+    OrchestrationRunFinishedEvent,
+    OrchestrationRunStartedEvent,
+    ReminderDismissedEvent,
+    ReminderSentEvent,
+    ReminderSnoozedEvent,
+    SuggestionAppliedEvent,
+    SuggestionEditedEvent,
+    SuggestionRejectedEvent,
+    SuggestionShownEvent,
+)
+
+# Event class per persisted event_type value, for O(1) lookup on every parsed line.
+_EVENT_CLASSES: dict[str, type[BaseEvent]] = {
+    EventType.MESSAGE_INGESTED.value: MessageIngestedEvent,
+    EventType.ARTIFACT_RECORDED.value: ArtifactRecordedEvent,
+    EventType.OBJECT_EXTRACTED.value: ObjectExtractedEvent,
+    EventType.DECISION_RECORDED.value: DecisionRecordedEvent,
+    EventType.ATTENTION_SCORING_COMPUTED.value: AttentionScoringComputedEvent,
+    EventType.SUGGESTION_SHOWN.value: SuggestionShownEvent,
+    EventType.SUGGESTION_APPLIED.value: SuggestionAppliedEvent,
+    EventType.SUGGESTION_REJECTED.value: SuggestionRejectedEvent,
+    EventType.SUGGESTION_EDITED.value: SuggestionEditedEvent,
+    EventType.REMINDER_SENT.value: ReminderSentEvent,
+    EventType.REMINDER_DISMISSED.value: ReminderDismissedEvent,
+    EventType.REMINDER_SNOOZED.value: ReminderSnoozedEvent,
+    EventType.FEATURE_SNAPSHOT_RECORDED.value: FeatureSnapshotRecordedEvent,
+    EventType.MODEL_SCORE_RECORDED.value: ModelScoreRecordedEvent,
+    EventType.FEEDBACK_EVIDENCE_RECORDED.value: FeedbackEvidenceRecordedEvent,
+    EventType.LAB_CONTROL_CHANGED.value: LabControlChangedEvent,
+    EventType.LAB_EXPERIMENT_RUN.value: LabExperimentRunEvent,
+    EventType.LAB_EXPERIMENT_APPLIED.value: LabExperimentAppliedEvent,
+    EventType.ORCHESTRATION_RUN_STARTED.value: OrchestrationRunStartedEvent,
+    EventType.ORCHESTRATION_RUN_CHECKPOINT.value: OrchestrationRunCheckpointEvent,
+    EventType.ORCHESTRATION_RUN_FINISHED.value: OrchestrationRunFinishedEvent,
+    EventType.ORCHESTRATION_RUN_FAILED.value: OrchestrationRunFailedEvent,
+    EventType.ORCHESTRATION_NODE_ENTERED.value: OrchestrationNodeEnteredEvent,
+    EventType.ORCHESTRATION_NODE_COMPLETED.value: OrchestrationNodeCompletedEvent,
+    EventType.ORCHESTRATION_NODE_RETRIED.value: OrchestrationNodeRetriedEvent,
+    EventType.ORCHESTRATION_NODE_FALLBACK.value: OrchestrationNodeFallbackEvent,
+    EventType.ORCHESTRATION_POLICY_ALLOWED.value: OrchestrationPolicyAllowedEvent,
+    EventType.ORCHESTRATION_POLICY_BLOCKED.value: OrchestrationPolicyBlockedEvent,
+    EventType.ORCHESTRATION_POLICY_ESCALATED.value: OrchestrationPolicyEscalatedEvent,
+    EventType.ORCHESTRATION_DELIVERY_ATTEMPTED.value: OrchestrationDeliveryAttemptedEvent,
+    EventType.ORCHESTRATION_DELIVERY_SUCCEEDED.value: OrchestrationDeliverySucceededEvent,
+    EventType.ORCHESTRATION_DELIVERY_FAILED.value: OrchestrationDeliveryFailedEvent,
+}
+
+# Window scanned back from the end of a shard to find the last complete line.
+_TAIL_SCAN_BYTES = 64 * 1024
+
+
+def _to_json_line(event: BaseEvent) -> bytes:
+    """Serialize an event to one JSONL record.
+
+    Same bytes as model_dump_json(), but taken straight from pydantic's Rust
+    serializer without the round trip through str, so shards can be written in
+    binary mode.
+    """
+    return event.__pydantic_serializer__.to_json(event) + b"\n"
+
+
+@dataclass(frozen=True)
+class EventLogPosition:
+    """Byte position in the event log: a shard file name and an offset within it."""
+
+    shard: str
+    offset: int
+
+    def __str__(self) -> str:
+        return f"{self.shard}:{self.offset}"
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> Optional["EventLogPosition"]:
+        """Parse a position rendered by str(); returns None for empty or malformed values."""
+        shard, sep, offset = (value or "").rpartition(":")
+        if not sep or not shard or not offset.isdigit():
+            return None
+        return cls(shard=shard, offset=int(offset))
 
 
 class FileEventStore:
@@ -38,15 +145,35 @@ class FileEventStore:
         """
         event_file = self._get_current_file()
 
-        # Serialize event to JSON
-        event_json = event.model_dump_json()
-
         # Append to file (atomic within line)
-        with open(event_file, "a") as f:
-            f.write(event_json + "\n")
+        with open(event_file, "ab") as f:
+            f.write(_to_json_line(event))
 
         return event.event_id
 
+    async def append_batch(self, events: list[BaseEvent]) -> list[UUID]:
+        """
+        Append several events to the store with a single write.
+
+        Args:
+            events: The events to append, in order
+
+        Returns:
+            The UUIDs of the appended events
+        """
+        if not events:
+            return []
+
+        event_file = self._get_current_file()
+
+        # Serialize all events up front so the file sees one contiguous write
+        payload = b"".join(map(_to_json_line, events))
+
+        with open(event_file, "ab") as f:
+            f.write(payload)
+
+        return [event.event_id for event in events]
+
     async def get_by_id(self, event_id: UUID) -> Optional[BaseEvent]:
         """
         Retrieve an event by its ID.
@@ -62,11 +189,11 @@ class FileEventStore:
             with open(event_file, "r") as f:
                 for line in f:
                     try:
-                        event_data = json.loads(line)
+                        event_data = orjson.loads(line)
                         if event_data.get("event_id") == str(event_id):
                             # Reconstruct event object
                             return self._deserialize_event(event_data)
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         continue
 
         return None
@@ -97,7 +224,7 @@ class FileEventStore:
             with open(event_file, "r") as f:
                 for line in f:
                     try:
-                        event_data = json.loads(line)
+                        event_data = orjson.loads(line)
 
                         # Filter by type
                         if event_data.get("event_type") != event_type.value:
@@ -117,158 +244,244 @@ class FileEventStore:
 
                         if limit and count >= limit:
                             return events
-                    except (json.JSONDecodeError, KeyError):
+                    except (orjson.JSONDecodeError, KeyError):
                         continue
 
         return events
 
-    async def stream_events(
+    def list_shards(self) -> list[Path]:
+        """Event log shards in chronological order."""
+        return sorted(self.data_dir.glob("events-*.jsonl"))
+
+    def tail_position(self) -> Optional[EventLogPosition]:
+        """
+        Get the position just past the last complete event in the log.
+
+        A trailing partial line (an append in progress) is excluded, so a
+        reader that stops here never consumes half an event.
+
+        Returns:
+            The tail position, or None if the log is empty
+        """
+        shard_paths = self.list_shards()
+        if not shard_paths:
+            return None
+
+        last_shard = shard_paths[-1]
+        with open(last_shard, "rb") as f:
+            size = f.seek(0, 2)
+            window = min(size, _TAIL_SCAN_BYTES)
+            f.seek(size - window)
+            tail = f.read(window)
+
+        newline = tail.rfind(b"\n")
+        if newline >= 0:
+            offset = size - window + newline + 1
+        else:
+            offset = 0 if window == size else size
+
+        return EventLogPosition(shard=last_shard.name, offset=offset)
+
+    def is_valid_position(self, position: EventLogPosition) -> bool:
+        """Check that a previously recorded position still exists in the log."""
+        shard = self.data_dir / position.shard
+        return shard.is_file() and shard.stat().st_size >= position.offset
+
+    def _shard_ranges(
+        self,
+        start: Optional[EventLogPosition] = None,
+        end: Optional[EventLogPosition] = None,
+    ) -> list[tuple[Path, int, Optional[int]]]:
+        """Resolve a [start, end) log range into per-shard byte ranges."""
+        ranges: list[tuple[Path, int, Optional[int]]] = []
+        for event_file in self.list_shards():
+            name = event_file.name
+            if start is not None and name < start.shard:
+                continue
+            if end is not None and name > end.shard:
+                break
+            begin = start.offset if start is not None and name == start.shard else 0
+            stop = end.offset if end is not None and name == end.shard else None
+            ranges.append((event_file, begin, stop))
+        return ranges
+
+    def _read_shard(self, event_file: Path, start: int = 0, end: Optional[int] = None) -> bytes:
+        """
+        Read an event log shard, or a byte range of it, in one call.
+
+        Shards are per-day files, so a bulk binary read stays bounded and avoids
+        line-buffered text decoding; orjson parses the raw bytes directly.
+        """
+        with open(event_file, "rb") as f:
+            if start:
+                f.seek(start)
+            if end is None:
+                return f.read()
+            return f.read(max(0, end - start))
+
+    def _prefetch_shards(
+        self, shard_ranges: list[tuple[Path, int, Optional[int]]]
+    ) -> Iterator[asyncio.Future]:
+        """
+        Yield shard reads in order, keeping the next read in flight.
+
+        Each read runs in a worker thread, so the following shard is loaded while
+        the caller parses the current one. At most two shards are held at once.
+        """
+        pending: Optional[asyncio.Future] = None
+        try:
+            for index, shard_range in enumerate(shard_ranges):
+                current = pending or asyncio.ensure_future(
+                    asyncio.to_thread(self._read_shard, *shard_range)
+                )
+                pending = None
+                if index + 1 < len(shard_ranges):
+                    pending = asyncio.ensure_future(
+                        asyncio.to_thread(self._read_shard, *shard_ranges[index + 1])
+                    )
+                yield current
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def iter_events(
         self,
         since: Optional[datetime] = None,
         event_types: Optional[list[EventType]] = None,
-    ) -> list[BaseEvent]:
+        start: Optional[EventLogPosition] = None,
+        end: Optional[EventLogPosition] = None,
+    ) -> AsyncIterator[BaseEvent]:
         """
-        Stream events from the log.
+        Lazily iterate events from the log, one at a time.
+
+        Unlike stream_events, nothing is materialized: callers that only need
+        running aggregates keep memory bounded by their own state.
 
         Args:
             since: Optional timestamp to start from
             event_types: Optional filter by event types
+            start: Optional log position to resume from (inclusive)
+            end: Optional log position to stop at (exclusive), e.g. tail_position()
 
-        Returns:
-            List of events matching criteria
+        Yields:
+            Events matching criteria, in log order
         """
-        events = []
+        event_type_values = {et.value for et in event_types} if event_types else None
 
-        for event_file in sorted(self.data_dir.glob("events-*.jsonl")):
-            with open(event_file, "r") as f:
-                for line in f:
-                    try:
-                        event_data = json.loads(line)
+        for raw in self._prefetch_shards(self._shard_ranges(start, end)):
+            for event in self._parse_events(await raw, since, event_type_values):
+                yield event
 
-                        # Filter by time
-                        if since:
-                            event_time = datetime.fromisoformat(
-                                event_data["timestamp"].replace("Z", "+00:00")
-                            )
-                            if event_time < since:
-                                continue
+    async def iter_events_with_positions(
+        self,
+        event_types: Optional[list[EventType]] = None,
+        start: Optional[EventLogPosition] = None,
+        end: Optional[EventLogPosition] = None,
+    ) -> AsyncIterator[tuple[BaseEvent, EventLogPosition]]:
+        """
+        Like iter_events, but also yield the log position just past each event.
 
-                        # Filter by type
-                        if event_types:
-                            event_type_values = [et.value for et in event_types]
-                            if event_data.get("event_type") not in event_type_values:
-                                continue
+        Resuming from a yielded position with start= continues after that event,
+        which lets callers checkpoint progress part-way through a long replay.
+        """
+        event_type_values = {et.value for et in event_types} if event_types else None
 
-                        events.append(self._deserialize_event(event_data))
-                    except (json.JSONDecodeError, KeyError):
+        shard_ranges = self._shard_ranges(start, end)
+        for (event_file, begin, _), raw in zip(shard_ranges, self._prefetch_shards(shard_ranges)):
+            shard = event_file.name
+            for event, offset in self._parse_lines(await raw, None, event_type_values, begin):
+                yield event, EventLogPosition(shard, offset)
+
+    def iter_shard_events(self, event_file: Path, end: Optional[int] = None) -> Iterator[BaseEvent]:
+        """
+        Synchronously iterate the events of a single shard, optionally up to a byte offset.
+
+        For callers that fan shards out to worker processes, where an event loop
+        per shard would only add overhead.
+        """
+        return self._parse_events(self._read_shard(event_file, end=end), None, None)
+
+    def _parse_events(
+        self,
+        data: bytes,
+        since: Optional[datetime],
+        event_type_values: Optional[set[str]],
+    ) -> Iterator[BaseEvent]:
+        """Parse raw shard bytes into events, applying time and type filters."""
+        for event, _ in self._parse_lines(data, since, event_type_values, 0):
+            yield event
+
+    def _parse_lines(
+        self,
+        data: bytes,
+        since: Optional[datetime],
+        event_type_values: Optional[set[str]],
+        base: int,
+    ) -> Iterator[tuple[BaseEvent, int]]:
+        """
+        Parse raw shard bytes into (event, offset) pairs.
+
+        The offset is the shard byte offset just past the event's line, given that
+        data was read starting at byte ``base``.
+        """
+        # Every serialized event carries its type as a quoted JSON string, so a
+        # shard or line without any of these tokens cannot match and is never parsed.
+        type_tokens = (
+            tuple(f'"{value}"'.encode() for value in event_type_values)
+            if event_type_values is not None
+            else None
+        )
+        if type_tokens is not None and not any(token in data for token in type_tokens):
+            return
+
+        # Serialized events never contain a raw newline, so splitting on b"\n"
+        # keeps line lengths exact for offset tracking.
+        offset = base
+        for line in data.split(b"\n"):
+            offset += len(line) + 1
+            if type_tokens is not None and not any(token in line for token in type_tokens):
+                continue
+            try:
+                event_data = orjson.loads(line)
+
+                # Filter by time
+                if since:
+                    event_time = datetime.fromisoformat(
+                        event_data["timestamp"].replace("Z", "+00:00")
+                    )
+                    if event_time < since:
                         continue
 
-        return events
+                # Filter by type
+                if event_type_values is not None:
+                    if event_data.get("event_type") not in event_type_values:
+                        continue
+
+                event = self._deserialize_event(event_data)
+            except (orjson.JSONDecodeError, KeyError):
+                continue
+
+            yield event, offset
+
+    async def stream_events(
+        self,
+        since: Optional[datetime] = None,
+        event_types: Optional[list[EventType]] = None,
+    ) -> list[BaseEvent]:
+        """
+        Stream events from the log.
+
+        Args:
+            since: Optional timestamp to start from
+            event_types: Optional filter by event types
+
+        Returns:
+            List of events matching criteria
+        """
+        return [event async for event in self.iter_events(since=since, event_types=event_types)]
 
     def _deserialize_event(self, event_data: dict) -> BaseEvent:
         """Deserialize event data back to event object."""
-        from shared.contracts import (
-            AttentionScoringComputedEvent,
-            ArtifactRecordedEvent,
-            DecisionRecordedEvent,
-            FeatureSnapshotRecordedEvent,
-            FeedbackEvidenceRecordedEvent,
-            LabControlChangedEvent,
-            LabExperimentAppliedEvent,
-            LabExperimentRunEvent,
-            OrchestrationDeliveryAttemptedEvent,
-            OrchestrationDeliveryFailedEvent,
-            OrchestrationDeliverySucceededEvent,
-            OrchestrationNodeCompletedEvent,
-            OrchestrationNodeEnteredEvent,
-            OrchestrationNodeFallbackEvent,
-            OrchestrationNodeRetriedEvent,
-            OrchestrationPolicyAllowedEvent,
-            OrchestrationPolicyBlockedEvent,
-            OrchestrationPolicyEscalatedEvent,
-            OrchestrationRunCheckpointEvent,
-            OrchestrationRunFailedEvent,
-            OrchestrationRunFinishedEvent,
-            OrchestrationRunStartedEvent,
-            MessageIngestedEvent,
-            ModelScoreRecordedEvent,
-            ObjectExtractedEvent,
-            ReminderDismissedEvent,
-            ReminderSentEvent,
-            ReminderSnoozedEvent,
-            SuggestionAppliedEvent,
-            SuggestionEditedEvent,
-            SuggestionRejectedEvent,
-            SuggestionShownEvent,
-        )
-
-        event_type = event_data.get("event_type")
-
-        # Map to appropriate event class
-        if event_type == EventType.MESSAGE_INGESTED.value:
-            return MessageIngestedEvent(**event_data)
-        elif event_type == EventType.ARTIFACT_RECORDED.value:
-            return ArtifactRecordedEvent(**event_data)
-        elif event_type == EventType.OBJECT_EXTRACTED.value:
-            return ObjectExtractedEvent(**event_data)
-        elif event_type == EventType.DECISION_RECORDED.value:
-            return DecisionRecordedEvent(**event_data)
-        elif event_type == EventType.ATTENTION_SCORING_COMPUTED.value:
-            return AttentionScoringComputedEvent(**event_data)
-        elif event_type == EventType.SUGGESTION_SHOWN.value:
-            return SuggestionShownEvent(**event_data)
-        elif event_type == EventType.SUGGESTION_APPLIED.value:
-            return SuggestionAppliedEvent(**event_data)
-        elif event_type == EventType.SUGGESTION_REJECTED.value:
-            return SuggestionRejectedEvent(**event_data)
-        elif event_type == EventType.SUGGESTION_EDITED.value:
-            return SuggestionEditedEvent(**event_data)
-        elif event_type == EventType.REMINDER_SENT.value:
-            return ReminderSentEvent(**event_data)
-        elif event_type == EventType.REMINDER_DISMISSED.value:
-            return ReminderDismissedEvent(**event_data)
-        elif event_type == EventType.REMINDER_SNOOZED.value:
-            return ReminderSnoozedEvent(**event_data)
-        elif event_type == EventType.FEATURE_SNAPSHOT_RECORDED.value:
-            return FeatureSnapshotRecordedEvent(**event_data)
-        elif event_type == EventType.MODEL_SCORE_RECORDED.value:
-            return ModelScoreRecordedEvent(**event_data)
-        elif event_type == EventType.FEEDBACK_EVIDENCE_RECORDED.value:
-            return FeedbackEvidenceRecordedEvent(**event_data)
-        elif event_type == EventType.LAB_CONTROL_CHANGED.value:
-            return LabControlChangedEvent(**event_data)
-        elif event_type == EventType.LAB_EXPERIMENT_RUN.value:
-            return LabExperimentRunEvent(**event_data)
-        elif event_type == EventType.LAB_EXPERIMENT_APPLIED.value:
-            return LabExperimentAppliedEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_RUN_STARTED.value:
-            return OrchestrationRunStartedEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_RUN_CHECKPOINT.value:
-            return OrchestrationRunCheckpointEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_RUN_FINISHED.value:
-            return OrchestrationRunFinishedEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_RUN_FAILED.value:
-            return OrchestrationRunFailedEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_NODE_ENTERED.value:
-            return OrchestrationNodeEnteredEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_NODE_COMPLETED.value:
-            return OrchestrationNodeCompletedEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_NODE_RETRIED.value:
-            return OrchestrationNodeRetriedEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_NODE_FALLBACK.value:
-            return OrchestrationNodeFallbackEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_POLICY_ALLOWED.value:
-            return OrchestrationPolicyAllowedEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_POLICY_BLOCKED.value:
-            return OrchestrationPolicyBlockedEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_POLICY_ESCALATED.value:
-            return OrchestrationPolicyEscalatedEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_DELIVERY_ATTEMPTED.value:
-            return OrchestrationDeliveryAttemptedEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_DELIVERY_SUCCEEDED.value:
-            return OrchestrationDeliverySucceededEvent(**event_data)
-        elif event_type == EventType.ORCHESTRATION_DELIVERY_FAILED.value:
-            return OrchestrationDeliveryFailedEvent(**event_data)
-        else:
-            # Fall back to base event
-            return BaseEvent(**event_data)
+        # Map to appropriate event class, falling back to base event
+        event_class = _EVENT_CLASSES.get(event_data.get("event_type"), BaseEvent)
+        return event_class(**event_data)
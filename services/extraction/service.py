@@ -76,6 +76,26 @@ class ExtractionService:
             logger.warning(f"Message event {message_event_id} not found or invalid type")
             return []
 
+        return await self.extract_from_event(message_event, context=context)
+
+    async def extract_from_event(
+        self, message_event: MessageIngestedEvent, context: Optional[dict] = None
+    ) -> list[tuple[UUID, str, dict]]:
+        """
+        Extract objects from a message event the caller already holds.
+
+        For a message that was just ingested: skips the event log lookup and the
+        already-extracted check, which cannot match a new message.
+
+        Args:
+            message_event: The MessageIngestedEvent to extract from
+            context: Optional context for extraction (conversation history, etc.)
+
+        Returns:
+            List of tuples (event_id, object_type, object_data) for extracted objects
+        """
+        message_event_id = message_event.event_id
+
         # Extract using LLM
         try:
             result = await self.llm_service.extract_objects(message_event.content, context=context)
@@ -36,14 +36,72 @@ class IngestionService:
         Returns:
             Event ID of the ingested message event
         """
-        event = MessageIngestedEvent(
+        event = await self.ingest_message_event(
+            content=content,
             source=source,
             source_id=source_id,
+            author=author,
+            conversation_id=conversation_id,
+            metadata=metadata,
+        )
+        return event.event_id
+
+    async def ingest_message_event(
+        self,
+        content: str,
+        source: SourceType,
+        source_id: str,
+        author: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        metadata: Optional[dict] = None,
+    ) -> MessageIngestedEvent:
+        """
+        Ingest a message and return the recorded event itself.
+
+        Takes the same arguments as ingest_message. Callers that extract right
+        away hand the event to ExtractionService.extract_from_event instead of
+        looking it up again by ID.
+        """
+        event = self._build_message_event(
             content=content,
+            source=source,
+            source_id=source_id,
             author=author,
             conversation_id=conversation_id,
-            metadata=metadata or {},
+            metadata=metadata,
         )
 
-        event_id = await self.event_store.append(event)
-        return event_id
+        await self.event_store.append(event)
+        return event
+
+    async def ingest_messages(self, messages: list[dict]) -> list[UUID]:
+        """
+        Ingest several messages with one append to the event store.
+
+        Args:
+            messages: One dict per message, with the keyword arguments of ingest_message
+
+        Returns:
+            Event IDs of the ingested message events, in input order
+        """
+        events = [self._build_message_event(**message) for message in messages]
+        return await self.event_store.append_batch(events)
+
+    def _build_message_event(
+        self,
+        content: str,
+        source: SourceType,
+        source_id: str,
+        author: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        metadata: Optional[dict] = None,
+    ) -> MessageIngestedEvent:
+        """Normalize one input message into its ingestion event."""
+        return MessageIngestedEvent(
+            source=source,
+            source_id=source_id,
+            content=content,
+            author=author,
+            conversation_id=conversation_id,
+            metadata=metadata or {},
+        )
@@ -2,6 +2,7 @@
 
 import sqlite3
 import logging
+import json
 import asyncio
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -195,6 +196,11 @@ def transaction(conn: sqlite3.Connection):
         conn.rollback()
         logger.error(f"Transaction failed, rolled back: {e}")
         raise
+    except BaseException:
+        # Cancellation (e.g. shutdown mid catch-up) must not leave the open
+        # transaction pending on the shared connection
+        conn.rollback()
+        raise
 
 
 # =============================================================================
@@ -296,6 +302,35 @@ def was_notification_sent_recently(
     return cursor.fetchone() is not None
 
 
+def get_recent_notification_fingerprints(
+    conn: sqlite3.Connection,
+    notification_type: str,
+    object_ids: list[str],
+    within_hours: int = 24,
+) -> set[str]:
+    """Fingerprints of notifications recently sent for any of ``object_ids``, in one query."""
+    if not object_ids:
+        return set()
+
+    cutoff = (datetime.utcnow() - timedelta(hours=within_hours)).isoformat()
+    placeholders = ", ".join("?" * len(object_ids))
+    cursor = conn.execute(
+        "SELECT metadata FROM notification_log "
+        f"WHERE notification_type = ? AND sent_at >= ? AND object_id IN ({placeholders})",
+        (notification_type, cutoff, *object_ids),
+    )
+
+    fingerprints = set()
+    for (metadata,) in cursor:
+        try:
+            fingerprint = json.loads(metadata).get("fingerprint")
+        except (TypeError, ValueError, AttributeError):
+            continue
+        if fingerprint:
+            fingerprints.add(fingerprint)
+    return fingerprints
+
+
 def log_notification(
     conn: sqlite3.Connection,
     notification_type: str,
@@ -27,6 +27,7 @@ CREATE INDEX IF NOT EXISTS idx_todos_priority ON todos(priority);
 CREATE INDEX IF NOT EXISTS idx_todos_due_date ON todos(due_date) WHERE due_date IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_todos_created_at ON todos(created_at);
 CREATE INDEX IF NOT EXISTS idx_todos_status_priority ON todos(status, priority);
+CREATE INDEX IF NOT EXISTS idx_todos_source_event_id ON todos(source_event_id);
 
 -- =============================================================================
 -- NOTES TABLE
@@ -124,6 +125,35 @@ CREATE INDEX IF NOT EXISTS idx_notification_log_type_date
 CREATE INDEX IF NOT EXISTS idx_notification_log_object 
     ON notification_log(object_id) WHERE object_id IS NOT NULL;
 
+-- =============================================================================
+-- OBJECT TAGS TABLE
+-- =============================================================================
+
+-- Normalized tags of todos/notes/tracks (one row per tag), kept in sync by the
+-- projectors so tag filters are index lookups instead of LIKE scans over JSON
+CREATE TABLE IF NOT EXISTS object_tags (
+    object_type TEXT NOT NULL CHECK(object_type IN ('todo', 'note', 'track')),
+    tag TEXT NOT NULL,
+    object_id TEXT NOT NULL,
+    PRIMARY KEY (object_type, tag, object_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_object_tags_object ON object_tags(object_type, object_id);
+
+-- Backfill databases projected before object_tags existed
+INSERT OR IGNORE INTO object_tags (object_type, tag, object_id)
+SELECT object_type, tag, object_id FROM (
+    SELECT 'todo' AS object_type, t.value AS tag, todos.object_id AS object_id
+    FROM todos, json_each(todos.tags) AS t WHERE todos.tags IS NOT NULL
+    UNION ALL
+    SELECT 'note', t.value, notes.object_id
+    FROM notes, json_each(notes.tags) AS t WHERE notes.tags IS NOT NULL
+    UNION ALL
+    SELECT 'track', t.value, tracks.object_id
+    FROM tracks, json_each(tracks.tags) AS t WHERE tracks.tags IS NOT NULL
+)
+WHERE NOT EXISTS (SELECT 1 FROM object_tags);
+
 -- =============================================================================
 -- INITIAL METADATA
 -- =============================================================================
@@ -19,7 +19,7 @@ from shared.contracts import (
     SourceType,
     TASK_LABEL_NEEDS_REVIEW,
 )
-from services.event_store.file_store import FileEventStore
+from services.event_store.file_store import EventLogPosition, FileEventStore
 from .database import (
     initialize_database,
     create_connection,
@@ -30,6 +30,10 @@ from .database import (
 
 logger = logging.getLogger(__name__)
 
+# Catch-up commits its progress every this many events, so an interrupted
+# replay resumes from the last batch instead of starting over.
+_CATCH_UP_BATCH_SIZE = 1000
+
 
 class QueryService:
     """
@@ -68,47 +72,130 @@ class QueryService:
         """Rebuild all projections from the event log."""
         logger.info("Starting projection rebuild...")
 
+        # Pin the end of the log first so events appended mid-rebuild are left
+        # for the next catch-up instead of being half-applied.
+        tail = self.event_store.tail_position()
+
         with transaction(self.conn):
             # 1. Clear all projection tables
             self.conn.execute("DELETE FROM todos")
             self.conn.execute("DELETE FROM notes")
             self.conn.execute("DELETE FROM tracks")
             self.conn.execute("DELETE FROM tasks")
+            self.conn.execute("DELETE FROM object_tags")
 
             logger.info("Cleared existing projections")
 
-            # 2. Stream all events relevant to projections
-            events = await self.event_store.stream_events(
-                event_types=[EventType.OBJECT_EXTRACTED, EventType.DECISION_RECORDED]
-            )
+            # 2. Stream all events relevant to projections and apply each one
+            processed, last_event_id = await self._apply_events(end=tail)
 
-            logger.info(f"Processing {len(events)} extraction events...")
+            logger.info(f"Processed {processed} extraction events")
 
-            # 3. Apply each event to appropriate table
-            todo_ordinals: dict[str, int] = {}
-            for event in events:
-                if isinstance(event, ObjectExtractedEvent):
-                    await self._apply_extraction_event(event, todo_ordinals)
-                elif isinstance(event, DecisionRecordedEvent):
-                    await self._apply_decision_event(event)
+            # 3. Update metadata
+            self._record_checkpoint(tail, last_event_id)
 
-            # 4. Update metadata
-            now = datetime.utcnow().isoformat()
-            self.conn.execute(
-                "INSERT OR REPLACE INTO projection_metadata (key, value, updated_at) "
-                "VALUES (?, ?, ?)",
-                ("last_rebuild_timestamp", now, now),
+        logger.info("Projection rebuild complete")
+
+    async def catch_up_projections(self):
+        """
+        Bring projections up to date by replaying only events since the last checkpoint.
+
+        The projection database acts as the snapshot: a rebuild or catch-up records
+        the log position it reached, and the next call applies just the delta.
+        Falls back to a full rebuild when no usable checkpoint exists.
+
+        Progress is committed every _CATCH_UP_BATCH_SIZE events together with the
+        log position reached, so a failure only loses the current batch.
+        """
+        checkpoint = EventLogPosition.parse(self._get_metadata("last_event_position"))
+        if checkpoint is None or not self.event_store.is_valid_position(checkpoint):
+            logger.info("No usable projection checkpoint; rebuilding from scratch")
+            await self.rebuild_projections()
+            return
+
+        tail = self.event_store.tail_position()
+        if tail == checkpoint:
+            return
+
+        with transaction(self.conn):
+            processed, last_event_id = await self._apply_events(
+                start=checkpoint, end=tail, resume=True, batch_size=_CATCH_UP_BATCH_SIZE
             )
+            self._record_checkpoint(tail, last_event_id)
 
-            if events:
-                last_event_id = str(events[-1].event_id)
-                self.conn.execute(
-                    "INSERT OR REPLACE INTO projection_metadata (key, value, updated_at) "
-                    "VALUES (?, ?, ?)",
-                    ("last_event_id_processed", last_event_id, now),
-                )
+        logger.info(f"Projection catch-up applied {processed} events")
 
-        logger.info("Projection rebuild complete")
+    async def _apply_events(
+        self,
+        start: Optional[EventLogPosition] = None,
+        end: Optional[EventLogPosition] = None,
+        resume: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> tuple[int, Optional[str]]:
+        """
+        Apply projection events in a log range; returns (count, last event id).
+
+        With batch_size, the checkpoint is advanced and committed after every
+        batch_size events. Only use it when the range extends existing projections,
+        never inside a rebuild that must stay atomic.
+        """
+        processed = 0
+        last_event_id = None
+        todo_ordinals: dict[str, int] = {}
+        async for event, position in self.event_store.iter_events_with_positions(
+            event_types=[EventType.OBJECT_EXTRACTED, EventType.DECISION_RECORDED],
+            start=start,
+            end=end,
+        ):
+            if isinstance(event, ObjectExtractedEvent):
+                if resume and event.object_type == "todo":
+                    self._seed_todo_ordinal(str(event.source_event_id), todo_ordinals)
+                await self._apply_extraction_event(event, todo_ordinals)
+            elif isinstance(event, DecisionRecordedEvent):
+                await self._apply_decision_event(event)
+            processed += 1
+            last_event_id = str(event.event_id)
+            if batch_size and processed % batch_size == 0:
+                self._record_checkpoint(position, last_event_id)
+                self.conn.commit()
+        return processed, last_event_id
+
+    def _seed_todo_ordinal(self, source_key: str, todo_ordinals: dict[str, int]):
+        """
+        Continue todo ordinals for a source message already partly projected.
+
+        Counts projected todos rather than tasks: every extracted todo takes an
+        ordinal, including untitled ones that never become a task.
+        """
+        if source_key in todo_ordinals:
+            return
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM todos WHERE source_event_id = ?", (source_key,)
+        ).fetchone()
+        todo_ordinals[source_key] = row[0]
+
+    def _record_checkpoint(
+        self, position: Optional[EventLogPosition], last_event_id: Optional[str]
+    ):
+        """Record how far projections have consumed the event log."""
+        now = datetime.utcnow().isoformat()
+        entries = [("last_rebuild_timestamp", now)]
+        if position is not None:
+            entries.append(("last_event_position", str(position)))
+        if last_event_id is not None:
+            entries.append(("last_event_id_processed", last_event_id))
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO projection_metadata (key, value, updated_at) "
+            "VALUES (?, ?, ?)",
+            [(key, value, now) for key, value in entries],
+        )
+
+    def _get_metadata(self, key: str) -> Optional[str]:
+        """Read a projection_metadata value."""
+        row = self.conn.execute(
+            "SELECT value FROM projection_metadata WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
 
     async def _apply_extraction_event(
         self,
@@ -203,6 +290,7 @@ class QueryService:
                 datetime.utcnow().isoformat(),
             ),
         )
+        self._index_tags("todo", str(todo.object_id), todo.tags)
 
     async def _upsert_note(self, data: dict):
         """Insert or update a note in the database."""
@@ -230,6 +318,7 @@ class QueryService:
                 datetime.utcnow().isoformat(),
             ),
         )
+        self._index_tags("note", str(note.object_id), note.tags)
 
     async def _upsert_track(self, data: dict):
         """Insert or update a track in the database."""
@@ -262,6 +351,32 @@ class QueryService:
                 datetime.utcnow().isoformat(),
             ),
         )
+        self._index_tags("track", str(track.object_id), track.tags)
+
+    def _index_tags(self, object_type: str, object_id: str, tags: Optional[list[str]]):
+        """Replace an object's rows in the normalized object_tags table."""
+        self.conn.execute(
+            "DELETE FROM object_tags WHERE object_type = ? AND object_id = ?",
+            (object_type, object_id),
+        )
+        if tags:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO object_tags (object_type, tag, object_id) "
+                "VALUES (?, ?, ?)",
+                [(object_type, tag, object_id) for tag in tags],
+            )
+
+    @staticmethod
+    def _tag_filter(object_type: str, tags: list[str]) -> tuple[str, list]:
+        """SQL fragment matching objects that carry every tag, via object_tags."""
+        clause = (
+            " AND object_id IN (SELECT object_id FROM object_tags"
+            " WHERE object_type = ? AND tag = ?)"
+        )
+        params = []
+        for tag in tags:
+            params.extend([object_type, tag])
+        return clause * len(tags), params
 
     async def _upsert_task(self, data: dict):
         """Insert or update a task in the database."""
@@ -326,11 +441,11 @@ class QueryService:
             query += " AND status = ?"
             params.append(status)
 
-        # Filter by tags (simple substring match in JSON)
+        # Filter by tags (index lookups in object_tags)
         if tags:
-            for tag in tags:
-                query += " AND tags LIKE ?"
-                params.append(f'%"{tag}"%')
+            tag_clause, tag_params = self._tag_filter("todo", tags)
+            query += tag_clause
+            params.extend(tag_params)
 
         query += " ORDER BY created_at DESC"
 
@@ -366,9 +481,9 @@ class QueryService:
 
         # Filter by tags
         if tags:
-            for tag in tags:
-                query += " AND tags LIKE ?"
-                params.append(f'%"{tag}"%')
+            tag_clause, tag_params = self._tag_filter("note", tags)
+            query += tag_clause
+            params.extend(tag_params)
 
         query += " ORDER BY created_at DESC"
 
@@ -380,12 +495,14 @@ class QueryService:
     async def get_tracks(
         self,
         status: Optional[str] = None,
+        tags: Optional[list[str]] = None,
     ) -> list[dict]:
         """
         Query tracking items with optional filters.
 
         Args:
             status: Optional status filter
+            tags: Optional tag filters
 
         Returns:
             List of matching tracks
@@ -398,6 +515,12 @@ class QueryService:
             query += " AND status = ?"
             params.append(status)
 
+        # Filter by tags
+        if tags:
+            tag_clause, tag_params = self._tag_filter("track", tags)
+            query += tag_clause
+            params.extend(tag_params)
+
         query += " ORDER BY created_at DESC"
 
         cursor = await execute_with_retry(self.conn, query, tuple(params))
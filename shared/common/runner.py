@@ -0,0 +1,21 @@
+"""Event loop entry point for command-line scripts."""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a script's main coroutine, on uvloop when it is installed.
+
+    uvloop ships with uvicorn[standard] on POSIX and cuts event loop overhead;
+    elsewhere this is plain asyncio.run.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
@@ -296,3 +296,26 @@ class TestAttentionAPI:
             assert all(item["model_score"] is None for item in deterministic_items)
         finally:
             ShadowRanker.score = original_method
+
+    def test_attention_reuses_startup_service(self, monkeypatch, tmp_path):
+        event_store_path = tmp_path / "events"
+        event_store_path.mkdir()
+        db_path = tmp_path / "projections" / "attention-shared.db"
+        db_path.parent.mkdir(parents=True)
+
+        monkeypatch.setenv("EVENT_STORE_PATH", str(event_store_path))
+        monkeypatch.setenv("PROJECTIONS_DB_PATH", str(db_path))
+        monkeypatch.setenv("ENV", "dev")
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "")
+
+        import services.api.routes.attention as attention_routes
+
+        def _no_per_request_service(*args, **kwargs):
+            raise AssertionError("attention route opened its own query service")
+
+        with TestClient(app) as started:
+            monkeypatch.setattr(attention_routes, "QueryService", _no_per_request_service)
+            assert started.get("/attention/today").status_code == 200
+            assert started.get("/attention/week").status_code == 200
+
+        assert app.state.attention is None
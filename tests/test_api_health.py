@@ -88,3 +88,22 @@ class TestHealthEndpoints:
         duration = time.time() - start
 
         assert duration < 0.5  # Should respond in under 500ms even with checks
+
+    def test_health_ready_waits_for_projection_catch_up(self, monkeypatch, tmp_path):
+        """Test readiness stays not_ready until the startup projection catch-up finishes."""
+        from types import SimpleNamespace
+
+        from services.api.main import app
+
+        (tmp_path / "events").mkdir()
+        (tmp_path / "projections").mkdir()
+        monkeypatch.setenv("EVENT_STORE_PATH", str(tmp_path / "events"))
+        monkeypatch.setenv("PROJECTIONS_DB_PATH", str(tmp_path / "projections" / "helionyx.db"))
+        monkeypatch.setenv("ENV", "dev")
+
+        monkeypatch.setattr(
+            app.state, "projections_catch_up", SimpleNamespace(done=lambda: False), raising=False
+        )
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["checks"]["projections_catch_up"]["complete"] is False
@@ -156,3 +156,104 @@ def test_replay_report_handles_insufficient_data(tmp_path):
     )
     assert report["stage_b_readiness"]["checks"]["rollback_verified"]["status"] == "fail"
     assert report["rollout_ready"] is False
+
+
+def test_replay_report_counts_duplicate_reminders(tmp_path):
+    store = FileEventStore(data_dir=str(tmp_path / "events"))
+    _append_events(
+        store,
+        [
+            ReminderSentEvent(reminder_type="urgent", object_id="t1", fingerprint="f1"),
+            ReminderSentEvent(reminder_type="urgent", object_id="t1", fingerprint="f1"),
+            ReminderSentEvent(reminder_type="urgent", object_id="t1", fingerprint="f1"),
+            ReminderSentEvent(reminder_type="urgent", object_id="t1", fingerprint="f2"),
+        ],
+    )
+
+    report = asyncio.run(build_report(str(tmp_path / "events")))
+
+    assert report["counts"]["reminders_sent"] == 4
+    assert report["metrics"]["duplicate_reminder_rate"] == 0.5
+    assert report["rollout_gates"]["duplicate_reminder_rate_below_5pct"]["status"] == "fail"
+
+
+def test_replay_report_parallel_shards_match_single_pass(tmp_path):
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+    shards = {
+        "2026-01-01": [
+            SuggestionShownEvent(task_id="t1", suggestion_id="s1", suggestion_type="split"),
+            ReminderSentEvent(reminder_type="urgent", object_id="t1", fingerprint="f1"),
+            ModelScoreRecordedEvent(
+                candidate_id="t1",
+                candidate_type="task",
+                model_name="m",
+                model_version="v1",
+                score=0.5,
+                confidence=0.9,
+            ),
+        ],
+        "2026-01-02": [
+            SuggestionShownEvent(
+                task_id="t1",
+                suggestion_id="s1",
+                suggestion_type="split",
+                metadata={"personalization_policy": "bounded_in_bucket"},
+            ),
+            SuggestionAppliedEvent(task_id="t1", suggestion_id="s1", suggestion_type="split"),
+            ReminderSentEvent(reminder_type="urgent", object_id="t1", fingerprint="f1"),
+            ModelScoreRecordedEvent(
+                candidate_id="t1",
+                candidate_type="task",
+                model_name="m",
+                model_version="v1",
+                score=0.5,
+                confidence=0.3,
+            ),
+        ],
+    }
+    for day, events in shards.items():
+        (events_dir / f"events-{day}.jsonl").write_text(
+            "".join(event.model_dump_json() + "\n" for event in events)
+        )
+
+    serial = asyncio.run(build_report(str(events_dir)))
+    parallel = asyncio.run(build_report(str(events_dir), workers=2))
+
+    for report in (serial, parallel):
+        report.pop("generated_at")
+    assert parallel == serial
+    assert serial["metrics"]["duplicate_reminder_rate"] == 0.5
+    assert serial["metrics"]["personalized_acceptance_rate"] == 1.0
+
+
+def test_replay_report_resumes_from_saved_state(tmp_path):
+    events_dir = str(tmp_path / "events")
+    state_path = tmp_path / "replay_state.json"
+    store = FileEventStore(data_dir=events_dir)
+    _append_events(
+        store,
+        [
+            SuggestionShownEvent(task_id="t1", suggestion_id="s1", suggestion_type="split"),
+            ReminderSentEvent(reminder_type="urgent", object_id="t1", fingerprint="f1"),
+        ],
+    )
+    first = asyncio.run(build_report(events_dir, state_path=state_path))
+    assert state_path.exists()
+    assert first["counts"]["events_total"] == 2
+
+    _append_events(
+        store,
+        [
+            SuggestionAppliedEvent(task_id="t1", suggestion_id="s1", suggestion_type="split"),
+            ReminderSentEvent(reminder_type="urgent", object_id="t1", fingerprint="f1"),
+        ],
+    )
+    resumed = asyncio.run(build_report(events_dir, state_path=state_path))
+    full = asyncio.run(build_report(events_dir))
+
+    for report in (resumed, full):
+        report.pop("generated_at")
+    assert resumed == full
+    assert resumed["counts"]["events_total"] == 4
+    assert resumed["metrics"]["duplicate_reminder_rate"] == 0.5
@@ -0,0 +1,81 @@
+"""Tests for FileEventStore read paths."""
+
+import asyncio
+
+from services.event_store.file_store import FileEventStore
+from shared.contracts import EventType, ReminderSentEvent, SuggestionShownEvent
+
+
+def _write_shard(store: FileEventStore, day: str, events: list) -> None:
+    path = store.data_dir / f"events-{day}.jsonl"
+    path.write_text("".join(event.model_dump_json() + "\n" for event in events))
+
+
+def test_iter_events_reads_shards_in_order(tmp_path):
+    store = FileEventStore(data_dir=str(tmp_path / "events"))
+    _write_shard(
+        store,
+        "2026-01-02",
+        [ReminderSentEvent(reminder_type="r3"), ReminderSentEvent(reminder_type="r4")],
+    )
+    _write_shard(
+        store,
+        "2026-01-01",
+        [ReminderSentEvent(reminder_type="r1"), ReminderSentEvent(reminder_type="r2")],
+    )
+    _write_shard(store, "2026-01-03", [ReminderSentEvent(reminder_type="r5")])
+
+    async def _run():
+        return [event.reminder_type async for event in store.iter_events()]
+
+    assert asyncio.run(_run()) == ["r1", "r2", "r3", "r4", "r5"]
+
+
+def test_stream_events_filters_types_and_skips_bad_lines(tmp_path):
+    store = FileEventStore(data_dir=str(tmp_path / "events"))
+    _write_shard(
+        store,
+        "2026-01-01",
+        [
+            ReminderSentEvent(reminder_type="urgent"),
+            SuggestionShownEvent(task_id="t1", suggestion_id="s1", suggestion_type="split"),
+        ],
+    )
+    with open(store.data_dir / "events-2026-01-01.jsonl", "a") as f:
+        f.write("not json\n\n")
+
+    events = asyncio.run(store.stream_events(event_types=[EventType.SUGGESTION_SHOWN]))
+
+    assert [event.event_type for event in events] == [EventType.SUGGESTION_SHOWN]
+
+
+def test_iter_events_type_filter_skips_shards_without_matches(tmp_path):
+    store = FileEventStore(data_dir=str(tmp_path / "events"))
+    _write_shard(store, "2026-01-01", [ReminderSentEvent(reminder_type="r1")])
+    _write_shard(
+        store,
+        "2026-01-02",
+        [SuggestionShownEvent(task_id="t1", suggestion_id="s1", suggestion_type="split")],
+    )
+    # Unparseable but free of the requested type token: must be skipped, not parsed
+    with open(store.data_dir / "events-2026-01-01.jsonl", "a") as f:
+        f.write("{truncated\n")
+
+    events = asyncio.run(store.stream_events(event_types=[EventType.SUGGESTION_SHOWN]))
+
+    assert [event.suggestion_id for event in events] == ["s1"]
+
+
+def test_append_batch_writes_events_in_order(tmp_path):
+    store = FileEventStore(data_dir=str(tmp_path / "events"))
+    events = [ReminderSentEvent(reminder_type=f"r{i}") for i in range(3)]
+
+    async def _run():
+        ids = await store.append_batch(events)
+        return ids, [event.reminder_type async for event in store.iter_events()]
+
+    ids, types = asyncio.run(_run())
+
+    assert ids == [event.event_id for event in events]
+    assert types == ["r0", "r1", "r2"]
+    assert asyncio.run(store.append_batch([])) == []
@@ -205,3 +205,27 @@ async def test_extraction_with_context(event_store, llm_service):
     # Should still extract successfully with context
     assert isinstance(result, ExtractionResult)
     assert len(result.objects) > 0
+
+
+@pytest.mark.asyncio
+async def test_extract_from_event_skips_log_lookup(event_store, extraction_service, monkeypatch):
+    """Test extracting from an in-memory event does not read the message back."""
+    from services.ingestion.service import IngestionService
+
+    message_event = await IngestionService(event_store).ingest_message_event(
+        content="Remind me to renew the passport",
+        source=SourceType.TELEGRAM,
+        source_id="test-in-memory",
+    )
+
+    async def _no_lookup(event_id):
+        raise AssertionError("message event was read back from the log")
+
+    monkeypatch.setattr(event_store, "get_by_id", _no_lookup)
+
+    extracted_items = await extraction_service.extract_from_event(message_event)
+
+    assert len(extracted_items) > 0
+    event_id, object_type, object_data = extracted_items[0]
+    assert object_type == "todo"
+    assert object_data["source_event_id"] == message_event.event_id
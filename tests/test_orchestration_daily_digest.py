@@ -53,7 +53,10 @@ async def test_daily_digest_runs_through_orchestration(monkeypatch, tmp_path):
     await scheduler.check_and_send_daily_digest(bot=object())
 
     assert send_mock.await_count == 1
-    sleep_mock.assert_awaited()
+    # The notification log dedupes the rest of the send window; no in-tick cooldown
+    sleep_mock.assert_not_awaited()
+    await scheduler.check_and_send_daily_digest(bot=object())
+    assert send_mock.await_count == 1
 
     events = await store.stream_events()
     event_types = [event.event_type for event in events]
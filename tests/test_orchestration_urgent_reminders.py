@@ -63,3 +63,44 @@ async def test_urgent_reminders_run_through_orchestration(monkeypatch, tmp_path)
     assert EventType.REMINDER_SENT in event_types
 
     query.close()
+
+
+@pytest.mark.asyncio
+async def test_urgent_reminders_skip_recently_sent_fingerprints(monkeypatch, tmp_path):
+    store = FileEventStore(data_dir=str(tmp_path / "events"))
+    query = QueryService(store, db_path=tmp_path / "projections" / "urgent-dedup.db")
+    task_service = TaskService(event_store=store, query_service=query)
+    for ref in ("m12-urgent-dedup-001", "m12-urgent-dedup-002"):
+        await task_service.ingest_task(
+            TaskIngestRequest(
+                title=f"Urgent reminder {ref}",
+                source=SourceType.API,
+                source_ref=ref,
+                priority=TaskPriority.P0,
+                due_at=datetime.utcnow() + timedelta(hours=2),
+            )
+        )
+
+    scheduler.event_store = store
+    scheduler.query_service = query
+    scheduler.db_conn = query.conn
+    scheduler.config = SimpleNamespace(
+        TELEGRAM_CHAT_ID="12345",
+        REMINDER_WINDOW_START=8,
+        REMINDER_WINDOW_END=21,
+        ATTENTION_URGENT_THRESHOLD=60.0,
+        SHADOW_RANKER_ENABLED=True,
+        SHADOW_RANKER_CONFIDENCE_THRESHOLD=0.6,
+    )
+
+    send_mock = AsyncMock()
+    monkeypatch.setattr(scheduler, "send_with_retry", send_mock)
+    monkeypatch.setattr(scheduler, "datetime", _FrozenDateTime)
+
+    await scheduler.check_and_send_urgent_reminders(bot=object())
+    assert send_mock.await_count == 2
+
+    await scheduler.check_and_send_urgent_reminders(bot=object())
+    assert send_mock.await_count == 2
+
+    query.close()
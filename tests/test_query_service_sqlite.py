@@ -224,6 +224,43 @@ async def test_get_notes_with_search(temp_db, temp_event_store):
     service.close()
 
 
+@pytest.mark.asyncio
+async def test_tag_filters_use_object_tags(temp_db, temp_event_store):
+    """Test tag filters match exact tags and follow re-projected objects."""
+    todo = Todo(title="Tagged todo", tags=["work", "home"], source_event_id=uuid4())
+    objects = [
+        ("todo", todo),
+        ("todo", Todo(title="Workshop", tags=["workshop"], source_event_id=uuid4())),
+        ("note", Note(title="Tagged note", content="c", tags=["work"], source_event_id=uuid4())),
+        ("track", Track(title="Tagged track", tags=["work"], source_event_id=uuid4())),
+    ]
+    for object_type, obj in objects:
+        await temp_event_store.append(
+            ObjectExtractedEvent(
+                object_type=object_type,
+                object_data=obj.model_dump(),
+                confidence=0.95,
+                source_event_id=uuid4(),
+            )
+        )
+
+    service = QueryService(temp_event_store, db_path=temp_db)
+    await service.rebuild_projections()
+
+    assert [t["title"] for t in await service.get_todos(tags=["work"])] == ["Tagged todo"]
+    assert [t["title"] for t in await service.get_todos(tags=["work", "home"])] == ["Tagged todo"]
+    assert await service.get_todos(tags=["work", "missing"]) == []
+    assert [n["title"] for n in await service.get_notes(tags=["work"])] == ["Tagged note"]
+    assert [t["title"] for t in await service.get_tracks(tags=["work"])] == ["Tagged track"]
+
+    # Re-projecting an object replaces its tags
+    await service._upsert_todo(todo.model_copy(update={"tags": ["home"]}).model_dump())
+    assert await service.get_todos(tags=["work"]) == []
+    assert [t["title"] for t in await service.get_todos(tags=["home"])] == ["Tagged todo"]
+
+    service.close()
+
+
 @pytest.mark.asyncio
 async def test_stats_after_rebuild(temp_db, temp_event_store):
     """Test stats are correct after rebuilding."""
@@ -257,3 +294,178 @@ async def test_stats_after_rebuild(temp_db, temp_event_store):
     assert stats["total_objects"] == 3
 
     service.close()
+
+
+@pytest.mark.asyncio
+async def test_catch_up_applies_only_new_events(temp_db, temp_event_store):
+    """Test catch-up resumes from the recorded log position."""
+    service = QueryService(temp_event_store, db_path=temp_db)
+
+    # No checkpoint yet: falls back to a full rebuild
+    note = Note(title="First", content="Content", source_event_id=uuid4())
+    await temp_event_store.append(
+        ObjectExtractedEvent(
+            object_type="note",
+            object_data=note.model_dump(),
+            confidence=0.95,
+            source_event_id=uuid4(),
+        )
+    )
+    await service.catch_up_projections()
+    assert [n["title"] for n in await service.get_notes()] == ["First"]
+
+    # Rows changed outside the log survive catch-up, proving no full replay
+    service.conn.execute("UPDATE notes SET title = 'Edited'")
+    service.conn.commit()
+
+    note = Note(title="Second", content="Content", source_event_id=uuid4())
+    await temp_event_store.append(
+        ObjectExtractedEvent(
+            object_type="note",
+            object_data=note.model_dump(),
+            confidence=0.95,
+            source_event_id=uuid4(),
+        )
+    )
+    await service.catch_up_projections()
+
+    assert sorted(n["title"] for n in await service.get_notes()) == ["Edited", "Second"]
+
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_catch_up_continues_todo_ordinals_after_untitled_todo(temp_db, temp_event_store):
+    """Test catch-up numbers a message's todos like a rebuild when one had no title."""
+    message_id = uuid4()
+
+    async def append_todo(title):
+        todo = Todo(title=title, source_event_id=message_id)
+        await temp_event_store.append(
+            ObjectExtractedEvent(
+                object_type="todo",
+                object_data=todo.model_dump(),
+                confidence=0.95,
+                source_event_id=message_id,
+            )
+        )
+
+    service = QueryService(temp_event_store, db_path=temp_db)
+    await append_todo("")
+    await append_todo("Alpha")
+    await service.catch_up_projections()
+
+    await append_todo("Beta")
+    await service.catch_up_projections()
+    caught_up = sorted(task["title"] for task in await service.get_tasks())
+
+    await service.rebuild_projections()
+    rebuilt = sorted(task["title"] for task in await service.get_tasks())
+
+    assert caught_up == rebuilt == ["Alpha", "Beta"]
+
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_catch_up_is_noop_when_log_unchanged(temp_db, temp_event_store):
+    """Test catch-up leaves projections alone when no events were appended."""
+    note = Note(title="Only", content="Content", source_event_id=uuid4())
+    await temp_event_store.append(
+        ObjectExtractedEvent(
+            object_type="note",
+            object_data=note.model_dump(),
+            confidence=0.95,
+            source_event_id=uuid4(),
+        )
+    )
+    service = QueryService(temp_event_store, db_path=temp_db)
+    await service.rebuild_projections()
+    last_rebuild = service.get_stats()["last_rebuild"]
+
+    await service.catch_up_projections()
+
+    assert service.get_stats()["last_rebuild"] == last_rebuild
+    assert [n["title"] for n in await service.get_notes()] == ["Only"]
+
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_catch_up_commits_progress_in_batches(temp_db, temp_event_store, monkeypatch):
+    """Test an interrupted catch-up keeps committed batches and resumes after them."""
+    import services.query.service as query_service
+
+    monkeypatch.setattr(query_service, "_CATCH_UP_BATCH_SIZE", 1)
+    service = QueryService(temp_event_store, db_path=temp_db)
+
+    for title in ["Zero", "One", "Two", "Three"]:
+        note = Note(title=title, content="Content", source_event_id=uuid4())
+        await temp_event_store.append(
+            ObjectExtractedEvent(
+                object_type="note",
+                object_data=note.model_dump(),
+                confidence=0.95,
+                source_event_id=uuid4(),
+            )
+        )
+        if title == "Zero":
+            await service.rebuild_projections()
+
+    apply_event = service._apply_extraction_event
+
+    async def fail_on_third(event, todo_ordinals=None):
+        if event.object_data["title"] == "Three":
+            raise RuntimeError("interrupted")
+        await apply_event(event, todo_ordinals)
+
+    monkeypatch.setattr(service, "_apply_extraction_event", fail_on_third)
+    with pytest.raises(RuntimeError):
+        await service.catch_up_projections()
+    assert sorted(n["title"] for n in await service.get_notes()) == ["One", "Two", "Zero"]
+
+    monkeypatch.setattr(service, "_apply_extraction_event", apply_event)
+    await service.catch_up_projections()
+    assert sorted(n["title"] for n in await service.get_notes()) == ["One", "Three", "Two", "Zero"]
+
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_catch_up_rolls_back_open_batch(temp_db, temp_event_store, monkeypatch):
+    """Test cancelling catch-up keeps committed batches and leaves no open transaction."""
+    import asyncio
+
+    import services.query.service as query_service
+
+    monkeypatch.setattr(query_service, "_CATCH_UP_BATCH_SIZE", 2)
+    service = QueryService(temp_event_store, db_path=temp_db)
+
+    for title in ["Zero", "One", "Two", "Three"]:
+        note = Note(title=title, content="Content", source_event_id=uuid4())
+        await temp_event_store.append(
+            ObjectExtractedEvent(
+                object_type="note",
+                object_data=note.model_dump(),
+                confidence=0.95,
+                source_event_id=uuid4(),
+            )
+        )
+        if title == "Zero":
+            await service.rebuild_projections()
+
+    apply_event = service._apply_extraction_event
+
+    async def cancel_on_third(event, todo_ordinals=None):
+        await apply_event(event, todo_ordinals)
+        if event.object_data["title"] == "Three":
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(service, "_apply_extraction_event", cancel_on_third)
+    with pytest.raises(asyncio.CancelledError):
+        await service.catch_up_projections()
+
+    assert not service.conn.in_transaction
+    assert sorted(n["title"] for n in await service.get_notes()) == ["One", "Two", "Zero"]
+
+    service.close()
@@ -0,0 +1,70 @@
+"""Tests for Telegram bot startup sequencing."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import services.adapters.telegram.bot as bot
+
+
+@pytest.mark.asyncio
+async def test_startup_not_started_when_application_build_fails(monkeypatch):
+    def _fail(*args, **kwargs):
+        raise RuntimeError("bad token")
+
+    startup = MagicMock()
+    monkeypatch.setattr(bot, "create_application", _fail)
+
+    with pytest.raises(RuntimeError):
+        await bot.start_bot("token", {}, cfg=object(), startup=startup)
+
+    startup.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_startup_runs_to_completion_when_initialize_fails(monkeypatch):
+    application = MagicMock()
+    application.initialize = AsyncMock(side_effect=RuntimeError("network down"))
+    monkeypatch.setattr(bot, "create_application", lambda *args: application)
+
+    finished = []
+
+    async def startup():
+        await asyncio.sleep(0.01)
+        finished.append(True)
+
+    with pytest.raises(RuntimeError, match="network down"):
+        await bot.start_bot("token", {}, cfg=object(), startup=startup)
+
+    assert finished == [True]
+    application.start.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stop_event_interrupts_slow_startup(monkeypatch):
+    application = MagicMock()
+    application.initialize = AsyncMock()
+    application.start = AsyncMock()
+    application.shutdown = AsyncMock()
+    monkeypatch.setattr(bot, "create_application", lambda *args: application)
+
+    stop_event = asyncio.Event()
+    cancelled = []
+
+    async def slow_startup():
+        stop_event.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    await asyncio.wait_for(
+        bot.start_bot("token", {}, cfg=object(), startup=slow_startup, stop_event=stop_event),
+        timeout=5,
+    )
+
+    assert cancelled == [True]
+    application.start.assert_not_called()
+    application.shutdown.assert_awaited_once()
@@ -0,0 +1,45 @@
+"""Tests for Telegram send retry handling."""
+
+import pytest
+from unittest.mock import AsyncMock
+from telegram.error import RetryAfter, TimedOut
+
+from services.adapters.telegram import errors
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(errors.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.mark.asyncio
+async def test_send_with_retry_waits_at_least_retry_after(sleeps):
+    """Test rate-limit retries wait Telegram's delay plus bounded jitter."""
+    bot = AsyncMock()
+    bot.send_message.side_effect = [RetryAfter(4), "sent"]
+
+    assert await errors.send_with_retry(bot, chat_id=1, text="hi") == "sent"
+
+    assert len(sleeps) == 1
+    assert 4 <= sleeps[0] <= 5
+
+
+@pytest.mark.asyncio
+async def test_send_with_retry_raises_after_last_timeout(sleeps):
+    """Test timeouts back off with jitter and re-raise on the final attempt."""
+    bot = AsyncMock()
+    bot.send_message.side_effect = TimedOut()
+
+    with pytest.raises(TimedOut):
+        await errors.send_with_retry(bot, chat_id=1, text="hi", max_retries=3)
+
+    assert bot.send_message.await_count == 3
+    assert 1 <= sleeps[0] <= 1.25
+    assert 2 <= sleeps[1] <= 2.5
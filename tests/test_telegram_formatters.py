@@ -1,7 +1,11 @@
 """Tests for Telegram formatters."""
 
 import pytest
+from datetime import datetime, timedelta, timezone
+
 from services.adapters.telegram.formatters import (
+    format_attention_daily_digest,
+    format_attention_weekly_digest,
     format_todos_list,
     format_notes_list,
     format_tracks_list,
@@ -137,3 +141,23 @@ def test_format_tasks_list_with_tasks():
     assert "Ship milestone" in result
     assert "Review queue" in result
     assert "⚠️" in result
+
+
+def test_attention_digests_format_due_datetimes():
+    """Test digests label datetime due dates like format_due_date does for strings."""
+    tomorrow = datetime.now(timezone.utc) + timedelta(days=1)
+    overdue = datetime.now() - timedelta(days=2, hours=1)
+    items = [
+        {"title": "Tomorrow task", "due_at": tomorrow},
+        {"title": "Late task", "due_at": overdue},
+        {"title": "Undated task", "due_at": None},
+    ]
+
+    daily = format_attention_daily_digest({"due_next_72h": items})
+    weekly = format_attention_weekly_digest({"due_this_week": items})
+
+    assert f"Tomorrow task ({format_due_date(tomorrow.isoformat())})" in daily
+    assert "Late task (2d overdue)" in daily
+    assert "Undated task (due soon)" in daily
+    assert "Late task (2d overdue)" in weekly
+    assert "Undated task (this week)" in weekly
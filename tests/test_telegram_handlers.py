@@ -148,3 +148,16 @@ async def test_task_priority_command(mock_update, mock_context, mock_task_servic
     mock_task_service.patch_task.assert_called_once()
     call_args = mock_update.message.reply_text.call_args[0][0]
     assert "priority set" in call_args
+
+
+@pytest.mark.asyncio
+async def test_command_errors_reply_with_apology(mock_update, mock_context, mock_task_service):
+    """Test unexpected handler errors are logged and answered with a generic reply."""
+    mock_task_service.list_tasks.side_effect = RuntimeError("boom")
+
+    await handlers.tasks_command(mock_update, mock_context)
+
+    mock_update.message.reply_text.assert_called_once_with(
+        "❌ Sorry, something went wrong. Please try again."
+    )
+    assert handlers.tasks_command.__name__ == "tasks_command"
@@ -0,0 +1,41 @@
+"""Tests for notification scheduler wake-up timing."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import services.adapters.telegram.scheduler as scheduler
+
+
+def _config(monkeypatch, **overrides):
+    settings = {
+        "REMINDER_WINDOW_START": 8,
+        "REMINDER_WINDOW_END": 21,
+        "DAILY_SUMMARY_HOUR": 20,
+        "WEEKLY_SUMMARY_DAY": 0,
+        "WEEKLY_SUMMARY_HOUR": 9,
+    }
+    settings.update(overrides)
+    monkeypatch.setattr(scheduler, "config", SimpleNamespace(**settings))
+
+
+def test_next_check_is_next_minute_inside_reminder_window(monkeypatch):
+    _config(monkeypatch)
+
+    # Monday 2026-03-02
+    assert scheduler._next_check_at(datetime(2026, 3, 2, 10, 2, 30)) == datetime(2026, 3, 2, 10, 3)
+    assert scheduler._next_check_at(datetime(2026, 3, 2, 21, 58, 59)) == datetime(
+        2026, 3, 2, 21, 59
+    )
+
+
+def test_next_check_sleeps_until_next_window_outside_hours(monkeypatch):
+    _config(monkeypatch)
+
+    assert not scheduler._any_window_open(datetime(2026, 3, 2, 23, 0))
+    assert scheduler._next_check_at(datetime(2026, 3, 2, 21, 59, 10)) == datetime(2026, 3, 3, 8, 0)
+
+    # A digest hour outside the reminder window wakes the scheduler for its first minutes
+    _config(monkeypatch, DAILY_SUMMARY_HOUR=23)
+    assert scheduler._next_check_at(datetime(2026, 3, 2, 22, 30)) == datetime(2026, 3, 2, 23, 0)
+    assert scheduler._next_check_at(datetime(2026, 3, 2, 23, 4, 10)) == datetime(2026, 3, 2, 23, 5)
+    assert scheduler._next_check_at(datetime(2026, 3, 2, 23, 5, 10)) == datetime(2026, 3, 3, 8, 0)